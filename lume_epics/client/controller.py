@@ -9,9 +9,10 @@ import logging
 from datetime import datetime
 from collections import defaultdict
 from functools import partial
-from epics import PV
+from epics import PV, ca
 import threading
 import sys
+import time
 from p4p.client.thread import Context, Disconnected
 
 
@@ -27,6 +28,23 @@ DEFAULT_IMAGE_DATA = {
 
 DEFAULT_SCALAR_VALUE = 0
 
+# child process variables served for Channel Access images
+CA_IMAGE_FIELDS = (
+    "ArrayData_RBV",
+    "ArraySizeX_RBV",
+    "ArraySizeY_RBV",
+    "MinX_RBV",
+    "MinY_RBV",
+    "MaxX_RBV",
+    "MaxY_RBV",
+)
+
+# child process variables served for Channel Access arrays
+CA_ARRAY_FIELDS = ("ArrayData_RBV", "ArraySize_RBV")
+
+# minimum time in seconds between direct fetches of a pv without a monitored value
+DEFAULT_FETCH_INTERVAL = 0.25
+
 
 # TODO: Track update dates per pv
 # Check missing pvnames
@@ -46,7 +64,17 @@ class Controller:
 
         _context (Context): P4P threaded context instance for use with pvAccess.
 
-        _pv_registry (dict): Registry mapping pvname to dict of value and pv monitor
+        _pv_registry (dict): Registry mapping pvname to dict of value and pv monitor.
+            A single monitor is shared by all callers requesting the same pvname.
+            Each entry also counts value updates under "version".
+
+        _monitors (dict): Registry mapping monitor class and variable name to the
+            monitor shared by widgets displaying that variable
+
+        _fetch_interval (float): Minimum time in seconds between direct fetches of a
+            process variable whose monitor has not yet delivered a value.
+
+        _listeners (tuple): Callbacks notified with the pvname of each monitor update
 
 
     Example:
@@ -63,7 +91,9 @@ class Controller:
 
     """
 
-    def __init__(self, epics_config: dict):
+    def __init__(
+        self, epics_config: dict, fetch_interval: float = DEFAULT_FETCH_INTERVAL
+    ):
         """
         Initializes controller. Stores protocol and creates context attribute if
         using pvAccess.
@@ -71,8 +101,15 @@ class Controller:
         Args:
             epics_config (dict): Dict describing epics configurations
 
+            fetch_interval (float): Minimum time in seconds between direct fetches
+                of a process variable whose monitor has not yet delivered a value.
+
         """
         self._pv_registry = defaultdict()
+        self._fetch_interval = fetch_interval
+        self._monitors = {}
+        # replaced rather than mutated so that monitor threads iterate a snapshot
+        self._listeners = ()
         # latest update
         self.last_update = ""
 
@@ -93,15 +130,21 @@ class Controller:
         if pva_config:
             self._context = Context("pva")
 
-        # utility maps
+        # utility maps, pvnames are interned so that registry lookups on the same
+        # name share a single string
         self._pvname_to_varname_map = {
-            config["pvname"]: varname for varname, config in epics_config.items()
+            sys.intern(config["pvname"]): varname
+            for varname, config in epics_config.items()
         }
 
         self._varname_to_pvname_map = {
-            varname: config["pvname"] for varname, config in epics_config.items()
+            varname: sys.intern(config["pvname"])
+            for varname, config in epics_config.items()
         }
 
+        # cache of Channel Access child pvnames by parent pvname
+        self._child_pvnames = {}
+
         # track protocols
         self._protocols = {
             epics_config[variable]["pvname"]: epics_config[variable]["protocol"]
@@ -116,16 +159,28 @@ class Controller:
 
             value (Union[np.ndarray, float]): Value to assign to process variable.
         """
-        self._pv_registry[pvname]["value"] = value
+        pv = self._pv_registry.get(pvname)
+
+        # late update after the controller was closed
+        if pv is None:
+            return
+
+        pv["value"] = value
+        pv["version"] += 1
 
         update_datetime = datetime.now().strftime("%m/%d/%Y, %H:%M:%S")
         self.last_update = update_datetime
         self._last_updates[pvname] = update_datetime
+        self._notify_listeners(pvname)
 
     def _ca_connection_callback(self, *, pvname, conn, pv):
         """Callback used for monitoring connection and setting values to None on disconnect."""
-        if not conn:
-            self._pv_registry[pvname]["value"] = None
+        pv = self._pv_registry.get(pvname)
+
+        if not conn and pv is not None:
+            pv["value"] = None
+            pv["version"] += 1
+            self._notify_listeners(pvname)
 
     def _pva_value_callback(self, pvname, value):
         """Callback executed by pvAccess monitor.
@@ -135,14 +190,51 @@ class Controller:
 
             value (Union[np.ndarray, float]): Value to assign to process variable.
         """
+        pv = self._pv_registry.get(pvname)
+
+        # late update after the controller was closed
+        if pv is None:
+            return
+
         if isinstance(value, Disconnected):
-            self._pv_registry[pvname]["value"] = None
+            pv["value"] = None
         else:
-            self._pv_registry[pvname]["value"] = value
+            pv["value"] = value
+
+        pv["version"] += 1
 
         update_datetime = datetime.now().strftime("%m/%d/%Y, %H:%M:%S")
         self.last_update = update_datetime
         self._last_updates[pvname] = update_datetime
+        self._notify_listeners(pvname)
+
+    def add_listener(self, callback) -> None:
+        """Registers a callback executed with the pvname whenever a monitored
+        process variable updates or disconnects. Callbacks run on the Channel Access
+        and pvAccess monitor threads and should return quickly.
+
+        Args:
+            callback (Callable): Function accepting a pvname
+
+        """
+        self._listeners = self._listeners + (callback,)
+
+    def remove_listener(self, callback) -> None:
+        """Unregisters a callback added with add_listener. Unknown callbacks are
+        ignored.
+
+        Args:
+            callback (Callable): Previously registered function
+
+        """
+        self._listeners = tuple(
+            listener for listener in self._listeners if listener != callback
+        )
+
+    def _notify_listeners(self, pvname: str) -> None:
+        """Executes registered listeners for a process variable update."""
+        for listener in self._listeners:
+            listener(pvname)
 
     def _set_up_pv_monitor(self, pvname, root=None):
         """Set up process variable monitor.
@@ -163,7 +255,12 @@ class Controller:
         if protocol == "ca":
 
             # add to registry (must exist for connection callback)
-            self._pv_registry[pvname] = {"pv": None, "value": None}
+            self._pv_registry[pvname] = {
+                "pv": None,
+                "value": None,
+                "fetched": 0,
+                "version": 0,
+            }
 
             # create the pv
             pv_obj = PV(
@@ -178,7 +275,12 @@ class Controller:
         elif protocol == "pva":
             cb = partial(self._pva_value_callback, pvname)
             # populate registry s.t. initially disconnected will populate
-            self._pv_registry[pvname] = {"pv": None, "value": None}
+            self._pv_registry[pvname] = {
+                "pv": None,
+                "value": None,
+                "fetched": 0,
+                "version": 0,
+            }
 
             # create the monitor obj
             mon_obj = self._context.monitor(pvname, cb, notify_disconnect=True)
@@ -186,6 +288,25 @@ class Controller:
             # update registry with the monitor
             self._pv_registry[pvname]["pv"] = mon_obj
 
+    def monitor(self, variable, monitor_class):
+        """Returns the monitor of the given class for a variable. Monitors are
+        created on first request and shared by all later callers.
+
+        Args:
+            variable (Variable): lume-model variable to monitor
+
+            monitor_class (type): Monitor class from lume_epics.client.monitors
+
+        """
+        key = (monitor_class, variable.name)
+        monitor = self._monitors.get(key)
+
+        if monitor is None:
+            monitor = monitor_class(variable, self)
+            self._monitors[key] = monitor
+
+        return monitor
+
     def get(self, pvname: str, root: str = None) -> np.ndarray:
         """
         Accesses and returns the value of a process variable.
@@ -194,6 +315,12 @@ class Controller:
             varname (str): Model variable name
 
         """
+        pv = self._pv_registry.get(pvname, None)
+
+        # values delivered by monitors are read directly from the registry
+        if pv is not None and pv["value"] is not None:
+            return pv["value"]
+
         self._set_up_pv_monitor(pvname, root=root)
 
         pv = self._pv_registry.get(pvname, None)
@@ -206,17 +333,76 @@ class Controller:
 
         if pv:
             val = pv["value"]
-            if val is None:
-                if protocol == "ca":
-                    val = pv["pv"].get()
 
-                elif protocol == "pva":
-                    val = self._context.get(pvname)
+            # fall back on a direct fetch, rate limited so that widgets sharing a
+            # pv do not each issue a request while the monitor is unpopulated
+            if val is None and time.time() - pv["fetched"] >= self._fetch_interval:
+                val = self._fetch(pvname, protocol)
 
             return val
 
         return None
 
+    def _fetch(self, pvname: str, protocol: str):
+        """Fetches the value of a process variable directly from the server. The
+        value is shared with other callers until the monitor delivers an update.
+
+        Args:
+            pvname (str): Process variable name
+
+            protocol (str): Protocol of the process variable ("ca" or "pva")
+
+        """
+        pv = self._pv_registry[pvname]
+        pv["fetched"] = time.time()
+
+        val = None
+        if protocol == "ca":
+            val = pv["pv"].get()
+
+        elif protocol == "pva":
+            val = self._context.get(pvname)
+
+        if pv["value"] is None and val is not None:
+            self._store_fetched(pvname, val)
+
+        return val
+
+    def _store_fetched(self, pvname: str, value) -> None:
+        """Stores a directly fetched value and notifies listeners of the update.
+
+        Args:
+            pvname (str): Process variable name
+
+            value (Union[np.ndarray, float]): Fetched value
+
+        """
+        pv = self._pv_registry[pvname]
+        pv["value"] = value
+        pv["version"] += 1
+        self._notify_listeners(pvname)
+
+    def get_version(self, varname: str) -> int:
+        """Returns a counter that increases whenever a value backing the variable
+        changes, including the child process variables of Channel Access images and
+        arrays. Used by monitors to skip redrawing unchanged values.
+
+        Args:
+            varname (str): Model variable name
+
+        """
+        pvname = self._get_pvname(varname)
+        pvnames = [pvname]
+
+        if pvname in self._child_pvnames:
+            pvnames.extend(self._child_pvnames[pvname].values())
+
+        return sum(
+            self._pv_registry[name]["version"]
+            for name in pvnames
+            if name in self._pv_registry
+        )
+
     def get_value(self, varname):
         """Gets scalar value of a process variable.
 
@@ -232,6 +418,83 @@ class Controller:
 
         return value
 
+    def get_values(self, varnames: List[str]) -> dict:
+        """Gets scalar values for several process variables. Monitors for all
+        variables are set up before any value is read so that connections are
+        established concurrently. Gets for unpopulated Channel Access variables are
+        all issued before any is awaited, and unpopulated pvAccess variables are
+        fetched with a single request.
+
+        Args:
+            varnames (List[str]): Model variable names
+
+        Returns:
+            dict: Mapping of variable name to value
+
+        """
+        pvnames = [self._get_pvname(varname) for varname in varnames]
+
+        for pvname in pvnames:
+            self._set_up_pv_monitor(pvname)
+
+        pending_ca = [
+            pvname
+            for pvname in pvnames
+            if self._protocols[pvname] == "ca"
+            and self._pv_registry[pvname]["value"] is None
+        ]
+
+        pending_pva = [
+            pvname
+            for pvname in pvnames
+            if self._protocols[pvname] == "pva"
+            and self._pv_registry[pvname]["value"] is None
+        ]
+
+        # issue all Channel Access gets before waiting on any of them
+        requested = []
+        for pvname in pending_ca:
+            pv_obj = self._pv_registry[pvname]["pv"]
+
+            if pv_obj.wait_for_connection():
+                ca.get(pv_obj.chid, wait=False)
+                requested.append(pvname)
+
+        for pvname in requested:
+            value = ca.get_complete(self._pv_registry[pvname]["pv"].chid)
+
+            if value is not None and self._pv_registry[pvname]["value"] is None:
+                self._store_fetched(pvname, value)
+
+        if pending_pva:
+            values = self._context.get(pending_pva, throw=False)
+
+            for pvname, value in zip(pending_pva, values):
+                if not isinstance(value, Exception):
+                    self._store_fetched(pvname, value)
+
+        return {varname: self.get_value(varname) for varname in varnames}
+
+    def connect_images(self, varnames: List[str]) -> None:
+        """Sets up monitors for image variables without waiting for values, so that
+        connections for all images are established concurrently ahead of the first
+        read.
+
+        Args:
+            varnames (List[str]): Model variable names
+
+        """
+        for varname in varnames:
+            pvname = self._get_pvname(varname)
+
+            if self._protocols[pvname] == "ca":
+                child_pvnames = self._get_child_pvnames(pvname)
+                for field in CA_IMAGE_FIELDS:
+                    self._set_up_pv_monitor(child_pvnames[field], root=pvname)
+
+            elif self._protocols[pvname] == "pva":
+                self._set_up_pv_monitor(pvname)
+
     def get_image(self, varname) -> dict:
         """Gets image data via controller protocol.
 
@@ -243,13 +506,14 @@ class Controller:
         image = None
 
         if self._protocols[pvname] == "ca":
-            image_flat = self.get(f"{pvname}:ArrayData_RBV", root=pvname)
-            nx = self.get(f"{pvname}:ArraySizeX_RBV", root=pvname)
-            ny = self.get(f"{pvname}:ArraySizeY_RBV", root=pvname)
-            x = self.get(f"{pvname}:MinX_RBV", root=pvname)
-            y = self.get(f"{pvname}:MinY_RBV", root=pvname)
-            x_max = self.get(f"{pvname}:MaxX_RBV", root=pvname)
-            y_max = self.get(f"{pvname}:MaxY_RBV", root=pvname)
+            child_pvnames = self._get_child_pvnames(pvname)
+            image_flat = self.get(child_pvnames["ArrayData_RBV"], root=pvname)
+            nx = self.get(child_pvnames["ArraySizeX_RBV"], root=pvname)
+            ny = self.get(child_pvnames["ArraySizeY_RBV"], root=pvname)
+            x = self.get(child_pvnames["MinX_RBV"], root=pvname)
+            y = self.get(child_pvnames["MinY_RBV"], root=pvname)
+            x_max = self.get(child_pvnames["MaxX_RBV"], root=pvname)
+            y_max = self.get(child_pvnames["MaxY_RBV"], root=pvname)
 
             if all(
                 [
@@ -298,8 +562,9 @@ class Controller:
         pvname = self._get_pvname(varname)
         array = None
         if self._protocols[pvname] == "ca":
-            array_flat = self.get(f"{pvname}:ArrayData_RBV", root=pvname)
-            shape = self.get(f"{pvname}:ArraySize_RBV", root=pvname)
+            child_pvnames = self._get_child_pvnames(pvname)
+            array_flat = self.get(child_pvnames["ArrayData_RBV"], root=pvname)
+            shape = self.get(child_pvnames["ArraySize_RBV"], root=pvname)
 
             if all([array_def is not None for array_def in [array_flat, shape]]):
 
@@ -330,8 +595,9 @@ class Controller:
         pvname = self._get_pvname(varname)
         self._set_up_pv_monitor(pvname)
 
-        # allow no puts before a value has been collected
-        registered = self.get(pvname)
+        # allow no puts before a value has been collected, fetching directly rather
+        # than waiting out the rate limit on fetches
+        registered = self._registered_value(pvname)
 
         # if the value is registered
         if registered is not None:
@@ -344,6 +610,54 @@ class Controller:
         else:
             logger.debug(f"No initial value set for {pvname}.")
 
+    def _registered_value(self, pvname: str):
+        """Returns the value collected for a process variable, fetching it directly
+        if the monitor has not yet delivered one. Unlike get, the fetch is not rate
+        limited, so that puts are not dropped while shared fetches are throttled.
+
+        Args:
+            pvname (str): Process variable name
+
+        """
+        value = self._pv_registry[pvname]["value"]
+
+        if value is None:
+            value = self._fetch(pvname, self._protocols[pvname])
+
+        return value
+
+    def put_values(self, values: dict, timeout: float = 1.0) -> None:
+        """Assign the values of several scalar process variables. Channel Access
+        puts do not wait for completion, and all pvAccess puts are issued in a
+        single request so that their round trips overlap.
+
+        Args:
+            values (dict): Mapping of model variable name to value
+
+            timeout (float): Operation timeout in seconds
+
+        """
+        pva_pvnames = []
+        pva_values = []
+
+        for varname, value in values.items():
+            pvname = self._get_pvname(varname)
+            self._set_up_pv_monitor(pvname)
+
+            # allow no puts before a value has been collected
+            if self._registered_value(pvname) is None:
+                logger.debug(f"No initial value set for {pvname}.")
+
+            elif self._protocols[pvname] == "ca":
+                self._pv_registry[pvname]["pv"].put(value, timeout=timeout)
+
+            elif self._protocols[pvname] == "pva":
+                pva_pvnames.append(pvname)
+                pva_values.append(value)
+
+        if pva_pvnames:
+            self._context.put(pva_pvnames, pva_values, throw=False, timeout=timeout)
+
     def put_image(
         self,
         varname,
@@ -381,29 +695,30 @@ class Controller:
         # if the value is registered
         if registered is not None:
             if self._protocols[pvname] == "ca":
+                child_pvnames = self._get_child_pvnames(pvname)
 
                 if image_array is not None:
-                    self._pv_registry[f"{pvname}:ArrayData_RBV"]["pv"].put(
+                    self._pv_registry[child_pvnames["ArrayData_RBV"]]["pv"].put(
                         image_array.flatten(), timeout=timeout
                     )
 
                 if x_min:
-                    self._pv_registry[f"{pvname}:MinX_RBV"]["pv"].put(
+                    self._pv_registry[child_pvnames["MinX_RBV"]]["pv"].put(
                         x_min, timeout=timeout
                     )
 
                 if x_max:
-                    self._pv_registry[f"{pvname}:MaxX_RBV"]["pv"].put(
+                    self._pv_registry[child_pvnames["MaxX_RBV"]]["pv"].put(
                         x_max, timeout=timeout
                     )
 
                 if y_min:
-                    self._pv_registry[f"{pvname}:MinY_RBV"]["pv"].put(
+                    self._pv_registry[child_pvnames["MinY_RBV"]]["pv"].put(
                         y_min, timeout=timeout
                     )
 
                 if y_max:
-                    self._pv_registry[f"{pvname}:MaxY_RBV"]["pv"].put(
+                    self._pv_registry[child_pvnames["MaxY_RBV"]]["pv"].put(
                         y_max, timeout=timeout
                     )
 
@@ -461,9 +776,10 @@ class Controller:
         # if the value is registered
         if registered is not None:
             if self._protocols[pvname] == "ca":
+                child_pvnames = self._get_child_pvnames(pvname)
 
                 if array is not None:
-                    self._pv_registry[f"{pvname}:ArrayData_RBV"]["pv"].put(
+                    self._pv_registry[child_pvnames["ArrayData_RBV"]]["pv"].put(
                         array.flatten(), timeout=timeout
                     )
 
@@ -479,9 +795,50 @@ class Controller:
             logger.debug(f"No initial value set for {pvname}.")
 
     def close(self):
+        """Removes all listeners, closes process variable monitors and closes the
+        pvAccess context.
+        """
+        self._listeners = ()
+
+        for pv in self._pv_registry.values():
+            monitor = pv["pv"]
+
+            if monitor is None:
+                continue
+
+            # Channel Access pv objects are disconnected, pvAccess subscriptions closed
+            if isinstance(monitor, PV):
+                monitor.clear_callbacks()
+                monitor.disconnect()
+
+            else:
+                monitor.close()
+
+        self._pv_registry.clear()
+        self._monitors.clear()
+
         if self._context is not None:
             self._context.close()
 
+    def _get_child_pvnames(self, pvname: str) -> dict:
+        """Returns the Channel Access image and array child pvnames of a process
+        variable, built once and cached.
+
+        Args:
+            pvname (str): Parent process variable name
+
+        """
+        child_pvnames = self._child_pvnames.get(pvname)
+
+        if child_pvnames is None:
+            child_pvnames = {
+                field: sys.intern(f"{pvname}:{field}")
+                for field in CA_IMAGE_FIELDS + CA_ARRAY_FIELDS
+            }
+            self._child_pvnames[pvname] = child_pvnames
+
+        return child_pvnames
+
     def _get_pvname(self, varname):
 
         pvname = self._varname_to_pvname_map.get(varname)
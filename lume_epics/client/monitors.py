@@ -54,17 +54,43 @@ class PVImage:
         self.axis_labels = variable.axis_labels
         self.axis_units = variable.axis_units
 
+        # reusable image data dictionary, refilled on each poll
+        self._image_data = {
+            "image": [None],
+            "x": [None],
+            "y": [None],
+            "dw": [None],
+            "dh": [None],
+        }
+
     def poll(self) -> Dict[str, list]:
-        """Collects image data and builds image data dictionary.
+        """Collects image data and fills the monitor's image data dictionary. The
+        same dictionary is returned on every poll; the image entry is a new list
+        so that bokeh data sources register the change.
 
         """
+        image_data = self.controller.get_image(self.varname)
+
+        self._image_data["image"] = [image_data["image"][0]]
+        self._image_data["x"][0] = image_data["x"][0]
+        self._image_data["y"][0] = image_data["y"][0]
+        self._image_data["dw"][0] = image_data["dw"][0]
+        self._image_data["dh"][0] = image_data["dh"][0]
+
+        return self._image_data
 
-        return self.controller.get_image(self.varname)
+    def version(self) -> int:
+        """Returns the controller's update counter for the image, which changes
+        whenever any of its process variables update.
+
+        """
+        return self.controller.get_version(self.varname)
 
 
 class PVTimeSeries:
     """
-    Monitor for time series variables.
+    Monitor for time series variables. Samples are stored in preallocated
+    contiguous buffers that grow by doubling, with times held as datetime64[ns].
 
     Attributes:
         time (np.ndarray): Array of times sampled.
@@ -92,8 +118,7 @@ class PVTimeSeries:
         """
         self.varname = variable.name
         self.tstart = time.time()
-        self.time = np.array([])
-        self.data = np.array([])
+        self._allocate_buffers()
 
         self.units = None
         # check if units has been set
@@ -107,18 +132,40 @@ class PVTimeSeries:
         Collects image data via appropriate protocol and returns time and data.
 
         """
-        t = datetime.now()
+        t = np.datetime64(datetime.now(), "ns")
 
         v = self.controller.get_value(self.varname)
 
-        self.time = np.append(self.time, t)
-        self.data = np.append(self.data, v)
+        # grow buffers if at capacity
+        if self._n_samples == len(self._time_buffer):
+            self._time_buffer = np.resize(self._time_buffer, 2 * self._n_samples)
+            self._data_buffer = np.resize(self._data_buffer, 2 * self._n_samples)
+
+        self._time_buffer[self._n_samples] = t
+        self._data_buffer[self._n_samples] = v
+        self._n_samples += 1
+
+        self.time = self._time_buffer[: self._n_samples]
+        self.data = self._data_buffer[: self._n_samples]
 
         return self.time, self.data
 
     def reset(self) -> None:
-        self.time = np.array([])
-        self.data = np.array([])
+        self._allocate_buffers()
+
+    def _allocate_buffers(self, capacity: int = 64) -> None:
+        """Allocates fresh sample buffers. New arrays are used so that views handed
+        out by previous polls are left untouched.
+
+        Args:
+            capacity (int): Initial number of samples to allocate for.
+
+        """
+        self._time_buffer = np.empty(capacity, dtype="datetime64[ns]")
+        self._data_buffer = np.empty(capacity, dtype=float)
+        self._n_samples = 0
+        self.time = self._time_buffer[:0]
+        self.data = self._data_buffer[:0]
 
 
 class PVScalar:
@@ -1,9 +1,22 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import Callable, List, Tuple
+from itertools import chain
+
+import numpy as np
+
 from lume_epics.utils import config_from_yaml
 from lume_model.utils import variables_from_yaml
-from bokeh.layouts import column, row, gridplot, layout
-from bokeh.models.widgets import Select
-from bokeh.models import Div
+from lume_model import variables as lume_variables
+from bokeh.layouts import column, gridplot, layout
+from bokeh.models import Div, Panel, Tabs, LinearColorMapper
 from bokeh import palettes
+from bokeh.core.property.validation import without_property_validation
 
 from lume_epics.client.controller import Controller
 
@@ -12,15 +25,135 @@ from lume_epics.client.widgets.controls import build_sliders, EntryTable
 from lume_epics.client.widgets.plots import Striptool, ImagePlot
 
 
+logger = logging.getLogger(__name__)
+
 pal = palettes.viridis(256)
 
-# striptool data update callback
-def striptool_update_callback():
+# bump when the sidecar layout changes to invalidate existing caches
+VARIABLE_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=32)
+def _load_variables(config_file: str, mtime_ns: int) -> tuple:
+    """Loads model variables from a yaml file. Results are cached by path and
+    modification time so that repeated renders skip parsing unchanged files. Across
+    processes, parsed variables are reused from a json sidecar written next to the
+    yaml file and keyed on its sha256 digest.
+
+    Args:
+        config_file (str): Path to the variable configuration file
+        mtime_ns (int): Modification time of the file in nanoseconds
+
+    Returns:
+        input_variables
+        output_variables
+
     """
-    Calls striptool update with the current global process variable.
+    with open(config_file, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    cache_file = config_file + ".cache.json"
+    variables = _read_variable_cache(cache_file, digest)
+
+    if variables is None:
+        with open(config_file, "r") as f:
+            variables = variables_from_yaml(f)
+
+        _write_variable_cache(cache_file, digest, *variables)
+
+    return variables
+
+
+def _serialize_variables(variables: dict) -> dict:
+    """Serializes lume-model variables into a json compatible dictionary."""
+    serialized = {}
+    for name, variable in variables.items():
+        fields = variable.dict(exclude_unset=True, by_alias=True)
+
+        for field, value in fields.items():
+            if isinstance(value, np.ndarray):
+                fields[field] = {
+                    "__ndarray__": value.tolist(),
+                    "dtype": str(value.dtype),
+                }
+
+        serialized[name] = {"class": type(variable).__name__, "fields": fields}
+
+    return serialized
+
+
+def _deserialize_variables(serialized: dict) -> dict:
+    """Rebuilds lume-model variables from a dictionary produced by
+    _serialize_variables."""
+    variables = {}
+    for name, item in serialized.items():
+        fields = item["fields"]
+
+        for field, value in fields.items():
+            if isinstance(value, dict) and "__ndarray__" in value:
+                fields[field] = np.array(value["__ndarray__"], dtype=value["dtype"])
+
+        variable_class = getattr(lume_variables, item["class"])
+        variables[name] = variable_class(**fields)
+
+    return variables
+
+
+def _read_variable_cache(cache_file: str, digest: str):
+    """Loads variables from a json sidecar cache if it matches the config digest.
+
+    Args:
+        cache_file (str): Path to the sidecar cache
+        digest (str): sha256 digest of the variable configuration file
+
+    Returns:
+        Tuple of input and output variables, or None if the cache is missing or stale
+
     """
-    global current_striptool_pv
-    striptool.update(live_variable=current_striptool_pv)
+    try:
+        with open(cache_file, "r") as f:
+            cache = json.load(f)
+
+        if cache["version"] != VARIABLE_CACHE_VERSION or cache["sha256"] != digest:
+            return None
+
+        return (
+            _deserialize_variables(cache["input_variables"]),
+            _deserialize_variables(cache["output_variables"]),
+        )
+
+    except FileNotFoundError:
+        return None
+
+    except Exception:
+        logger.debug("Unable to load variable cache %s", cache_file, exc_info=True)
+        return None
+
+
+def _write_variable_cache(
+    cache_file: str, digest: str, input_variables: dict, output_variables: dict
+) -> None:
+    """Writes variables to a json sidecar cache. Failures are logged and ignored.
+
+    Args:
+        cache_file (str): Path to the sidecar cache
+        digest (str): sha256 digest of the variable configuration file
+        input_variables (dict): Input variables parsed from the configuration
+        output_variables (dict): Output variables parsed from the configuration
+
+    """
+    try:
+        cache = {
+            "version": VARIABLE_CACHE_VERSION,
+            "sha256": digest,
+            "input_variables": _serialize_variables(input_variables),
+            "output_variables": _serialize_variables(output_variables),
+        }
+        with open(cache_file, "w") as f:
+            json.dump(cache, f)
+
+    except Exception:
+        logger.debug("Unable to write variable cache %s", cache_file, exc_info=True)
 
 
 class LayoutBuilder:
@@ -31,20 +164,20 @@ class LayoutBuilder:
         _ncol_widgets (int): Number of columns used to render layout
         _input_header (Div): Bokeh div item for designating inputs
         _output_header (Div): Bokeh div item for designating outputs
-        _input_layout (list): List tracking inputs to render
-        _output_layout (list): List tracking outputs to render
+        _input_layout (list): List tracking (title, item) pairs of inputs to render
+        _output_layout (list): List tracking (title, item) pairs of outputs to render
     """
 
     def __init__(self, ncol_widgets: int):
         self._ncol_widgets = ncol_widgets
         self._input_header = Div(
             text="<h3 style='text-align:center;'>Live Model Inputs</h1>",
-            sizing_mode="scale_both",
+            sizing_mode="stretch_width",
             margin=(0, 0, 0, 0),
         )
         self._output_header = Div(
             text="<h3 style='text-align:center;'>Live Model Outputs</h1>",
-            sizing_mode="scale_both",
+            sizing_mode="stretch_width",
             margin=(0, 0, 0, 0),
         )
         self._input_layout = []
@@ -57,15 +190,7 @@ class LayoutBuilder:
             layout_item: Bokeh object to be added to inputs
             title (str): Optional title for the item
         """
-
-        if title:
-            title_div = Div(
-                text=f"<p style='text-align:center;'>{title}</p>",
-                sizing_mode="scale_both",
-            )
-            layout_item = column(title_div, layout_item, sizing_mode="scale_both")
-
-        self._input_layout.append(layout_item)
+        self._input_layout.append((self._build_title(title), layout_item))
 
     def add_output(self, layout_item, title: str = None) -> None:
         """Add bokeh item to the output layout.
@@ -74,15 +199,7 @@ class LayoutBuilder:
             layout_item: Bokeh object to be added to outputs
             title (str): Optional title for the item
         """
-
-        if title:
-            title_div = Div(
-                text=f"<p style='text-align:center;'>{title}</p>",
-                sizing_mode="scale_both",
-            )
-            layout_item = column(title_div, layout_item, sizing_mode="scale_both")
-
-        self._output_layout.append(layout_item)
+        self._output_layout.append((self._build_title(title), layout_item))
 
     def add_input_stack(self, layout_items: list, title: str = None) -> None:
         """Add stacked items as an input layout item.
@@ -92,16 +209,7 @@ class LayoutBuilder:
             title (str): Optional title for the stack
 
         """
-        layout_item = column(layout_items)
-
-        if title:
-            title_div = Div(
-                text=f"p style='text-align:center;'>{title}</p>",
-                sizing_mode="scale_both",
-            )
-            layout_item = column(title_div, layout_item, sizing_mode="scale_both")
-
-        self._input_layout.append(layout_item)
+        self.add_input(column(layout_items), title=title)
 
     def add_output_stack(self, layout_items: list, title: str = None) -> None:
         """Add stacked items as an output layout item.
@@ -110,29 +218,47 @@ class LayoutBuilder:
             layout_items (list): list of items to add to layout
             title (str): Optional title for the stack
         """
-        layout_item = column(layout_items)
+        self.add_output(column(layout_items), title=title)
 
-        if title:
-            title_div = Div(
-                text=f"p style='text-align:center;'>{title}</h1>",
-                sizing_mode="scale_both",
-                margin=(0, 0, 0, 0),
-            )
-            layout_item = column(title_div, layout_item, sizing_mode="scale_both")
+    def _build_title(self, title: str = None):
+        """Builds the title cell for a layout item.
+
+        Args:
+            title (str): Optional title for the item
+        """
+        if not title:
+            return None
+
+        return Div(
+            text=f"<p style='text-align:center;'>{title}</p>",
+            sizing_mode="stretch_width",
+        )
 
-        else:
-            self._output_layout.append(layout_item)
+    def _build_grid(self, items: list):
+        """Builds a single grid from (title, layout item) pairs. Titles are placed in
+        the row directly above their items rather than wrapped in nested columns.
+
+        Args:
+            items (list): List of (title, layout item) pairs
+        """
+        rows = []
+        for i in range(0, len(items), self._ncol_widgets):
+            chunk = items[i : i + self._ncol_widgets]
+
+            if any(title is not None for title, _ in chunk):
+                rows.append([title for title, _ in chunk])
+
+            rows.append([layout_item for _, layout_item in chunk])
+
+        return gridplot(rows)
 
     def build_layout(self):
-        """Builds layout for rendering with bokeh document.
+        """Builds layout for rendering with bokeh document. Sizing is set once on the
+        root layout and inherited by grids that do not define their own policy.
 
         """
-        input_grid = gridplot(
-            self._input_layout, ncols=self._ncol_widgets, sizing_mode="scale_both"
-        )
-        output_grid = gridplot(
-            self._output_layout, ncols=self._ncol_widgets, sizing_mode="scale_both"
-        )
+        input_grid = self._build_grid(self._input_layout)
+        output_grid = self._build_grid(self._output_layout)
 
         built_layout = [
             self._input_header,
@@ -143,18 +269,152 @@ class LayoutBuilder:
         return layout(built_layout, name="layout", sizing_mode="scale_both")
 
 
+class LazyTabs:
+    """
+    Tabs whose widgets are only constructed the first time their tab is shown. The
+    first tab is built immediately.
+
+    Attributes:
+        tabs (Tabs): Bokeh tabs item for adding to a layout
+        _builders (list): Functions returning a bokeh item and its update callback
+        _built (list): Flags indicating which tabs have been constructed
+        _updates (list): Update callbacks of the constructed widgets
+    """
+
+    def __init__(self, builders: List[Tuple[str, Callable]]):
+        """
+        Args:
+            builders (List[Tuple[str, Callable]]): Tab titles paired with functions
+                that build a widget and return its bokeh item and update callback.
+        """
+        self._builders = [builder for _, builder in builders]
+        self._built = [False] * len(builders)
+        self._updates = []
+
+        panels = [
+            Panel(child=Div(text="Loading..."), title=title) for title, _ in builders
+        ]
+        self.tabs = Tabs(tabs=panels)
+        self.tabs.on_change("active", self._on_active)
+
+        if builders:
+            self._build(0)
+
+    def _build(self, index: int) -> None:
+        """Constructs the widget for a tab, registers its update callback, and
+        shows the current values without waiting for the next monitor update.
+        """
+        layout_item, update = self._builders[index]()
+        self.tabs.tabs[index].child = layout_item
+        self._updates.append(update)
+        self._built[index] = True
+        update()
+
+    def _on_active(self, attr, old, new) -> None:
+        """Bokeh callback constructing the widget of a newly activated tab."""
+        if not self._built[new]:
+            self._build(new)
+
+    def update(self) -> None:
+        """Updates all constructed widgets."""
+        for update in self._updates:
+            update()
+
+
+def batch_callbacks(doc, callbacks: List[Callable]) -> Callable:
+    """Combines widget update callbacks into a single callback. Document events
+    emitted by the callbacks are held and sent to the client together once all
+    callbacks have run, with repeated changes to the same property combined into
+    the latest.
+
+    Args:
+        doc (Document): Bokeh document the callbacks update
+        callbacks (List[Callable]): Update callbacks to combine
+
+    Returns:
+        Callable
+
+    """
+
+    # snapshot the callbacks once so each tick iterates a fixed tuple
+    callbacks = tuple(callbacks)
+
+    # property validation is skipped for the values set by the updates
+    @without_property_validation
+    def run_callbacks():
+        doc.hold("combine")
+        try:
+            for callback in callbacks:
+                callback()
+
+        finally:
+            doc.unhold()
+
+    return run_callbacks
+
+
+def push_callbacks(doc, controller: Controller, callbacks: List[Callable]) -> Callable:
+    """Runs widget update callbacks on the document's next tick whenever the
+    controller's monitors receive an update, rather than polling. Updates arriving
+    before a scheduled run are coalesced into that run.
+
+    Args:
+        doc (Document): Bokeh document the callbacks update
+        controller (Controller): Controller whose monitors drive the updates
+        callbacks (List[Callable]): Update callbacks to run
+
+    Returns:
+        Callable: Function unregistering the updates, to be called when the
+            document's session is destroyed
+
+    """
+    run_callbacks = batch_callbacks(doc, callbacks)
+    pending = threading.Event()
+    stopped = threading.Event()
+
+    def run():
+        pending.clear()
+        if not stopped.is_set():
+            run_callbacks()
+
+    def schedule(pvname):
+        if not pending.is_set() and not stopped.is_set():
+            pending.set()
+            doc.add_next_tick_callback(run)
+
+    def stop():
+        stopped.set()
+        controller.remove_listener(schedule)
+
+    controller.add_listener(schedule)
+
+    return stop
+
+
 def render_from_yaml(
-    config_file, epics_config_file, read_only=False, striptool_limit=50, ncol_widgets=5,
+    config_file,
+    epics_config_file,
+    read_only=False,
+    striptool_limit=50,
+    ncol_widgets=5,
+    controller: Controller = None,
+    striptool_callbacks: List[Callable] = None,
 ):
     """Renders a bokeh layout from the configuration file. Returns layout and callbacks.
 
     Args:
-        config_file: Opened configuration file
+        config_file: Path to the variable configuration file or opened file
+        epics_config_file: Path to the EPICS configuration file
         prefix (str): Prefix for setting up controller
         protocol (str): Indicates whether to use channel access ("ca") or pvAccess ("pva")
         read_only (bool): Whether to render the page as read only
         striptool_limit (int): Maximum number of steps to display on the striptool
         ncol_widgets (int): Number of columns for rendering widgets
+        controller (Controller): Optional controller to use, one is created from the
+            EPICS configuration if not provided
+        striptool_callbacks (List[Callable]): Optional list collecting the striptool
+            update callbacks, which sample at a fixed period and so are kept apart
+            from the returned callbacks when given
 
     Returns
         layout
@@ -162,81 +422,88 @@ def render_from_yaml(
 
     """
 
-    # load variables
-    with open(config_file, "r") as f:
-        input_variables, output_variables = variables_from_yaml(f)
+    # load variables, reusing the parse if the file is unchanged
+    if isinstance(config_file, (str, os.PathLike)):
+        config_file = os.path.abspath(config_file)
+        input_variables, output_variables = _load_variables(
+            config_file, os.stat(config_file).st_mtime_ns
+        )
+
+    else:
+        input_variables, output_variables = variables_from_yaml(config_file)
 
     # load variables
     with open(epics_config_file, "r") as f:
         epics_config = config_from_yaml(f)
 
-    # variables
-    constant_scalars = []
-    constant_images = []
-    variable_input_scalars = []
-    variable_output_scalars = []
-    variable_input_images = []
-    variable_output_images = []
-
-    # organize input variables
+    # bucket variables by (variable_type, is_constant) in a single pass
+    input_buckets = defaultdict(list)
     for variable in input_variables.values():
-        if variable.variable_type == "scalar":
-            if variable.is_constant:
-                constant_scalars.append(variable)
-
-            else:
-                variable_input_scalars.append(variable)
-
-        elif variable.variable_type == "image":
-            if variable.is_constant:
-                constant_images.append(variable)
+        key = (variable.variable_type, bool(getattr(variable, "is_constant", False)))
+        input_buckets[key].append(variable)
 
-            else:
-                variable_input_images.append(variable)
-
-    # organize output variables
+    output_buckets = defaultdict(list)
     for variable in output_variables.values():
-        if variable.variable_type == "scalar":
-            variable_output_scalars.append(variable)
+        output_buckets[variable.variable_type].append(variable)
 
-        if variable.variable_type == "image":
-            variable_output_images.append(variable)
+    constant_scalars = input_buckets[("scalar", True)]
+    variable_input_scalars = input_buckets[("scalar", False)]
+    constant_images = input_buckets[("image", True)]
+    variable_input_images = input_buckets[("image", False)]
+    variable_output_scalars = output_buckets["scalar"]
+    variable_output_images = output_buckets["image"]
 
     # set up controller
-    controller = Controller(epics_config)
+    if controller is None:
+        controller = Controller(epics_config)
 
     # track callbacks
     callbacks = []
+    if striptool_callbacks is None:
+        striptool_callbacks = callbacks
 
     # track all inputs
     input_value_vars = constant_scalars + variable_input_scalars
 
     layout_builder = LayoutBuilder(ncol_widgets)
 
+    # color mapper shared by all image plots in this document. Bokeh models may only
+    # belong to a single document, so this cannot be shared at module level.
+    color_mapper = LinearColorMapper(palette=pal)
+
+    # start all image connections concurrently ahead of the first update
+    controller.connect_images(
+        [
+            variable.name
+            for variable in chain(
+                variable_input_images, constant_images, variable_output_images
+            )
+        ]
+    )
+
     # add images
-    for variable in variable_input_images + constant_images:
-        image = ImagePlot([variable], controller)
-        image.build_plot(pal)
+    for variable in chain(variable_input_images, constant_images):
+        image = ImagePlot([variable], controller, color_mapper=color_mapper)
         layout_builder.add_input(image.plot, title=variable.name)
         callbacks.append(image.update)
 
-    # build input striptools
+    # build input striptool
     if read_only:
-        for variable in variable_input_scalars:
-            striptool = Striptool([variable], controller, limit=striptool_limit)
-            layout_builder.add_input(striptool.plot, title=variable.name)
-            callbacks.append(striptool.update)
+        if variable_input_scalars:
+            input_striptool = Striptool(
+                variable_input_scalars, controller, limit=striptool_limit
+            )
+            layout_builder.add_input_stack(
+                [input_striptool.selection, input_striptool.plot]
+            )
+            striptool_callbacks.append(input_striptool.update)
 
     # build sliders and value entry table
     else:
         sliders = build_sliders(variable_input_scalars, controller)
 
-        slider_stack = []
-        for slider in sliders:
-            slider_stack.append(slider.bokeh_slider)
-            callbacks.append(slider.update)
-
-        layout_builder.add_input_stack(slider_stack)
+        layout_builder.add_input_stack([slider.bokeh_slider for slider in sliders])
+        callbacks.extend(slider.update for slider in sliders)
 
         # build value entry
         value_entry = EntryTable(input_value_vars, controller)
@@ -257,22 +524,23 @@ def render_from_yaml(
     layout_builder.add_output(output_value_table.table)
     callbacks.append(output_value_table.update)
 
-    for variable in variable_output_images:
-        image = ImagePlot([variable], controller)
-        image.build_plot(pal)
-        layout_builder.add_output(image.plot, title=variable.name)
-        callbacks.append(image.update)
-
-    # build output striptools
-    if read_only:
-
-        for variable in variable_output_scalars:
-
-            striptool = Striptool([variable], controller, limit=striptool_limit)
-            layout_builder.add_output(striptool.plot, title=variable.name)
-            callbacks.append(striptool.update)
+    def build_image(variable):
+        image = ImagePlot([variable], controller, color_mapper=color_mapper)
+        return image.plot, image.update
+
+    # output images are only built once their tab is shown
+    if variable_output_images:
+        image_tabs = LazyTabs(
+            [
+                (variable.name, partial(build_image, variable))
+                for variable in variable_output_images
+            ]
+        )
+        layout_builder.add_output(image_tabs.tabs)
+        callbacks.append(image_tabs.update)
 
-    else:
+    # build a single output striptool with variable selection
+    if variable_output_scalars:
         output_striptool = Striptool(
             variable_output_scalars, controller, limit=striptool_limit
         )
@@ -282,7 +550,7 @@ def render_from_yaml(
         )
 
         # add the update callback
-        callbacks.append(output_striptool.update)
+        striptool_callbacks.append(output_striptool.update)
 
     layout = layout_builder.build_layout()
 
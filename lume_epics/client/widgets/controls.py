@@ -4,7 +4,7 @@ Controls may be built for lume-model ScalarInputVariables.
 
 """
 
-from functools import partial
+from functools import lru_cache
 from typing import Union, List
 import logging
 
@@ -14,65 +14,154 @@ from bokeh.models import (
     DataTable,
     TableColumn,
     StringFormatter,
-    TextInput,
     StringEditor,
     Button,
     TextEditor,
     HTMLTemplateFormatter,
-    Paragraph,
+    CellEditor,
 )
 from bokeh.events import Tap, MouseLeave, ButtonClick
 from bokeh.models.callbacks import CustomJS
 from bokeh import document
-from bokeh.layouts import column, row, gridplot
+from bokeh.layouts import column, row
 
 from lume_model.variables import ScalarInputVariable
 from lume_epics.client.controller import Controller
+from lume_epics.client.monitors import PVScalar
 
 logger = logging.getLogger(__name__)
 
+# window in milliseconds over which slider puts are coalesced
+PUT_DELAY_MS = 50
+
+
+def _get_units(variable: ScalarInputVariable) -> str:
+    """Returns the units of a variable, or None if they have not been set."""
+    if "units" in variable.__fields_set__:
+        return variable.units
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def _slider_params(name: str, units: str, start: float, end: float) -> tuple:
+    """Computes slider title and range settings for a variable. Bokeh models
+    belong to a single document, so sessions share these parameters rather than
+    the sliders themselves.
+
+    Args:
+        name (str): Variable name.
+
+        units (str): Variable units, or None if not set.
+
+        start (float): Start of the variable's range.
+
+        end (float): End of the variable's range.
+
+    """
+    title = name
+    if units is not None:
+        title += " (" + units + ")"
+
+    step = (end - start) / 100.0
+
+    return title, start, end, step
+
+
+def _make_put_callback(
+    pvname: str, controller: Controller, model, delay_ms: int = PUT_DELAY_MS
+):
+    """Builds a bokeh change callback putting new values to a process variable.
+    Values arriving within delay_ms of a scheduled put replace the pending value,
+    so only the latest value is put. Puts are made immediately if the model is
+    not attached to a document.
+
+    Args:
+        pvname (str): Name of the process variable.
+
+        controller (Controller): Controller object for interacting with process
+            variable values.
+
+        model (Model): Bokeh model whose document schedules the puts.
+
+        delay_ms (int): Window in milliseconds for coalescing puts.
+
+    """
+    put = controller.put
+    pending = {}
+
+    def flush():
+        put(pvname, pending.pop("value"))
+
+    def set_pv(attr, old, new):
+        doc = model.document
+
+        if doc is None:
+            put(pvname, new)
+            return
+
+        scheduled = "value" in pending
+        pending["value"] = new
+
+        if not scheduled:
+            doc.add_timeout_callback(flush, delay_ms)
+
+    return set_pv
+
 
 class EpicsSlider:
     """EPICS based Slider used for building bokeh sliders and synchronizing process variable values.
 
     """
 
-    def __init__(self, variable: ScalarInputVariable, controller: Controller):
+    def __init__(
+        self,
+        variable: ScalarInputVariable,
+        controller: Controller,
+        value: float = None,
+        units: str = None,
+    ):
         self.controller = controller
         self.variable = variable
-        self.build_slider()
+        self.monitor = controller.monitor(variable, PVScalar)
+        self._last_value = value
+
+        if units is None:
+            units = _get_units(variable)
+
+        self._units = units
+        self.build_slider(value=value)
 
-    def build_slider(self):
+    def build_slider(self, value: float = None):
         """
         Utility function for building a slider.
 
         Args:
-            variable (ScalarInputVariable): Variable associated with the slider.
-
-            controller (Controller): Controller object for getting process variable values.
+            value (float): Initial slider value. Defaults to the start of the
+                variable's range.
 
         """
-        title = self.variable.name
-        if "units" in self.variable.__fields_set__:
-            title += " (" + self.variable.units + ")"
-
         self.pvname = self.variable.name
-        step = (self.variable.value_range[1] - self.variable.value_range[0]) / 100.0
+        title, start, end, step = _slider_params(
+            self.variable.name,
+            self._units,
+            self.variable.value_range[0],
+            self.variable.value_range[1],
+        )
+
+        if value is None:
+            value = start
 
         # construct slider
         self.bokeh_slider = Slider(
-            title=title,
-            value=self.variable.value_range[0],
-            start=self.variable.value_range[0],
-            end=self.variable.value_range[1],
-            step=step,
-            format="0[.]0000",
+            title=title, value=value, start=start, end=end, step=step, format="0[.]0000",
         )
 
-        # set up callback
+        # value_throttled only changes on mouse release, so dragging the slider
+        # puts a single value rather than one per intermediate step
         self.bokeh_slider.on_change(
-            "value",
-            partial(set_pv_from_slider, pvname=self.pvname, controller=self.controller),
+            "value_throttled",
+            _make_put_callback(self.pvname, self.controller, self.bokeh_slider),
         )
 
     def update(self):
@@ -80,17 +169,27 @@ class EpicsSlider:
         Updates bokeh slider with the process variable value.
 
         """
-        self.bokeh_slider.value = self.controller.get_value(self.pvname)
-    
+        value = self.monitor.poll()
+
+        # skip unchanged values
+        if value == self._last_value:
+            return
+
+        self._last_value = value
+        self.bokeh_slider.value = value
+
     def reset(self):
+        self._last_value = self.variable.default
         self.bokeh_slider.value = self.variable.default
+        self.controller.put(self.pvname, self.variable.default)
 
 
 def build_sliders(
     variables: List[ScalarInputVariable], controller: Controller,
 ) -> List[Slider]:
     """
-    Build sliders for a list of variables.
+    Build sliders for a list of variables. Initial values for all sliders are
+    collected with a single batched controller read.
 
     Args:
         variables (List[ScalarInputVariable]): List of variables for which to build sliders.
@@ -100,49 +199,32 @@ def build_sliders(
     """
     sliders = []
 
+    values = controller.get_values([variable.name for variable in variables])
+
     for variable in variables:
-        slider = EpicsSlider(variable, controller,)
+        slider = EpicsSlider(
+            variable,
+            controller,
+            value=values[variable.name],
+            units=_get_units(variable),
+        )
         sliders.append(slider)
 
     return sliders
 
 
-def set_pv_from_slider(
-    attr: str, old: float, new: float, pvname: str, controller: Controller,
-) -> None:
-    """
-    Callback function for updating process variables on slider change.
-
-    Args:
-        attr (str): Attribute to update.
-
-        old (float): Prior slider value.
-
-        new (float): New value assigned by slider.
-
-        pvname (str): Name of the process variable.
-
-        controller (Controller): Controller object for interacting with process
-            variable values.
-
-    """
-    controller.put(pvname, new)
-
-
 class EntryTable:
     """
-    Table of process variable names and values.
+    Table of process variable names and entered values, rendered as a single
+    editable bokeh DataTable.
 
     Attriibutes:
-        pv_monitors (Dict[str, PVScalar]): Monitors associated with process variables.
-
-        output_values (dict): Dict mapping process variable name to current value.
-
         labels (dict): Dict mapping process variable name to labels.
 
-        source (ColumnDataSource): Data source for populating bokeh table.
+        source (ColumnDataSource): Data source for populating bokeh table, holding
+            variable names, labels, and entered values.
 
-        labels (Dict[list, list]): Dictionary mapping pvname to label
+        table (DataTable): Bokeh table with an editable value column.
 
     """
 
@@ -173,40 +255,44 @@ class EntryTable:
         self._button_aspect_ratio = button_aspect_ratio
 
         # add labels
-        self._labels = labels
-
-        # be sure to surface units in the table
-        self.unit_map = {}
-        self.text_inputs = {}
-
-        grid_layout = []
+        self._labels = dict(labels)
 
         for variable in variables:
 
             label_base = labels.get(variable.name, variable.name)
+            units = _get_units(variable)
 
             # check if units assigned
-            if "units" in variable.__fields_set__ and variable.units:
-                self._labels[variable.name] = label_base + f" ({variable.units})"
+            if units:
+                self._labels[variable.name] = label_base + f" ({units})"
 
             else:
                 self._labels[variable.name] = label_base
 
-            entry_title = Paragraph(
-                text=self._labels[variable.name],
-                align="start",
-                sizing_mode="scale_both",
-            )
-
-            self.text_inputs[variable.name] = TextInput(
-                name=variable.name, sizing_mode="scale_both"
-            )
-
-            # create columns
-            grid_layout.append([entry_title, self.text_inputs[variable.name]])
-
-        # set up table
-        self.table = gridplot(grid_layout, sizing_mode="scale_both")
+        # build all columns up front so the source is constructed in one step
+        variable_names = [variable.name for variable in variables]
+        table_data = {
+            "name": variable_names,
+            "label": [self._labels[name] for name in variable_names],
+            "value": [""] * len(variable_names),
+        }
+
+        self.source = ColumnDataSource(table_data)
+
+        # set up table, labels are made read only with the base cell editor
+        columns = [
+            TableColumn(field="label", title="Variable", editor=CellEditor()),
+            TableColumn(field="value", title="Value", editor=StringEditor()),
+        ]
+
+        self.table = DataTable(
+            source=self.source,
+            columns=columns,
+            editable=True,
+            index_position=None,
+            row_height=row_height,
+            sizing_mode="scale_both",
+        )
 
         # Set up buttons
         self.clear_button = Button(
@@ -227,15 +313,27 @@ class EntryTable:
 
     def submit(self) -> None:
         """
-        Function to submit values entered into table
+        Function to submit values entered into table. Edits are only read here,
+        so no callback is registered on the data source.
         """
-        for variable_name, text_input in self.text_inputs.items():
-            if text_input.value_input != "":
-                self.controller.put(variable_name, text_input.value_input)
+        values = {
+            variable_name: value
+            for variable_name, value in zip(
+                self.source.data["name"], self.source.data["value"]
+            )
+            if value != ""
+        }
+
+        # submit all values together so puts are not made one round trip at a time
+        if values:
+            self.controller.put_values(values)
 
     def clear(self) -> None:
         """
         Function to clear all entered values
         """
-        for _, text_input in self.text_inputs.items():
-            text_input.value_input = ""
+        values = self.source.data["value"]
+
+        # replace only the value column, and only when something was entered
+        if any(value != "" for value in values):
+            self.source.data.update(value=[""] * len(values))
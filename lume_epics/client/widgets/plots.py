@@ -4,6 +4,7 @@ variables and a lume_epics.client.controller.Controller for interfacing with the
 process variables.
 """
 
+from datetime import datetime
 from typing import List
 import logging
 import numpy as np
@@ -19,7 +20,7 @@ from lume_epics.client.controller import (
     DEFAULT_IMAGE_DATA,
     DEFAULT_SCALAR_VALUE,
 )
-from lume_epics.client.monitors import PVImage, PVTimeSeries
+from lume_epics.client.monitors import PVImage, PVScalar
 
 logger = logging.getLogger(__name__)
 
@@ -82,11 +83,20 @@ class ImagePlot:
         self._color_mapper = color_mapper
         self._palette = palette
 
+        # axis labels are fixed per variable, so build them once
+        self._axis_labels = {}
+
         for variable in variables:
-            self.pv_monitors[variable.name] = PVImage(variable, controller)
+            self.pv_monitors[variable.name] = controller.monitor(variable, PVImage)
+            self._axis_labels[variable.name] = self._build_axis_labels(
+                self.pv_monitors[variable.name]
+            )
 
         self.live_variable = list(self.pv_monitors.keys())[0]
 
+        # version of the displayed image, monitors are shared between plots
+        self._displayed_version = None
+
         image_data = DEFAULT_IMAGE_DATA
 
         image_data["image"][0] = np.flipud(image_data["image"][0].T)
@@ -142,18 +152,26 @@ class ImagePlot:
                 "Must provide palette or color mapper during ImagePlot construction."
             )
 
-        axis_labels = self.pv_monitors[self.live_variable].axis_labels
-        axis_units = self.pv_monitors[self.live_variable].axis_units
+        self._set_axis_labels()
+
+    @staticmethod
+    def _build_axis_labels(monitor: PVImage) -> tuple:
+        """Builds the x and y axis labels, including units, for an image monitor."""
+        x_axis_label = monitor.axis_labels[0]
+        y_axis_label = monitor.axis_labels[1]
 
-        x_axis_label = axis_labels[0]
-        y_axis_label = axis_labels[1]
+        if monitor.axis_units:
+            x_axis_label += " (" + monitor.axis_units[0] + ")"
+            y_axis_label += " (" + monitor.axis_units[1] + ")"
 
-        if axis_units:
-            x_axis_label += " (" + axis_units[0] + ")"
-            y_axis_label += " (" + axis_units[1] + ")"
+        return x_axis_label, y_axis_label
 
-        self.plot.xaxis.axis_label = x_axis_label
-        self.plot.yaxis.axis_label = y_axis_label
+    def _set_axis_labels(self) -> None:
+        """Labels the plot axes with the live variable's axis labels and units."""
+        (
+            self.plot.xaxis.axis_label,
+            self.plot.yaxis.axis_label,
+        ) = self._axis_labels[self.live_variable]
 
     def update(self, live_variable: str = None) -> None:
         """
@@ -163,26 +181,24 @@ class ImagePlot:
         Args:
             live_variable (str): Variable to display
         """
-        # update internal pv trackinng
-        if live_variable:
-            self.live_variable = live_variable
+        variable_changed = live_variable and live_variable != self.live_variable
 
-        # update axis and labels
-        axis_labels = self.pv_monitors[self.live_variable].axis_labels
-        axis_units = self.pv_monitors[self.live_variable].axis_units
+        # update internal pv tracking, axis labels only change with the variable
+        if variable_changed:
+            self.live_variable = live_variable
+            self._set_axis_labels()
 
-        x_axis_label = axis_labels[0]
-        y_axis_label = axis_labels[1]
+        monitor = self.pv_monitors[self.live_variable]
 
-        if axis_units:
-            x_axis_label += " (" + axis_units[0] + ")"
-            y_axis_label += " (" + axis_units[1] + ")"
+        # skip resending an unchanged image
+        version = monitor.version()
+        if not variable_changed and version == self._displayed_version:
+            return
 
-        self.plot.xaxis.axis_label = x_axis_label
-        self.plot.yaxis.axis_label = y_axis_label
+        self._displayed_version = version
 
         # get image data
-        image_data = self.pv_monitors[self.live_variable].poll()
+        image_data = monitor.poll()
         image_data["image"][0] = np.flipud(image_data["image"][0].T)
 
         self.source.data.update(image_data)
@@ -190,15 +206,17 @@ class ImagePlot:
 
 class Striptool:
     """
-    View for striptool display.
+    View for striptool display. All tracked variables are sampled on each update
+    and streamed as a single row into one data source with a column per variable.
 
     Attributes:
 
         live_variable (str): Variable to be displayed.
 
-        source (ColumnDataSource): Data source for the striptool view.
+        source (ColumnDataSource): Data source for the striptool view, holding a
+            time column "x" and one column per variable.
 
-        pv_monitors (PVScalarMonitor): Monitors for the tracked process variables.
+        pv_monitors (Dict[str, PVScalar]): Monitors for the tracked process variables.
 
         plot (Figure): Bokeh figure object.
 
@@ -225,15 +243,21 @@ class Striptool:
 
         """
         self.pv_monitors = {}
+        self._y_axis_labels = {}
 
         for variable in variables:
-            self.pv_monitors[variable.name] = PVTimeSeries(variable, controller)
+            monitor = controller.monitor(variable, PVScalar)
+            self.pv_monitors[variable.name] = monitor
+
+            # add units to label
+            if monitor.units:
+                self._y_axis_labels[variable.name] = f"{variable.name} ({monitor.units})"
+            else:
+                self._y_axis_labels[variable.name] = variable.name
 
         self.live_variable = list(self.pv_monitors.keys())[0]
 
-        ts = []
-        ys = []
-        self.source = ColumnDataSource(dict(x=ts, y=ys))
+        self.source = ColumnDataSource(self._empty_data())
         self.reset_button = Button(label="Reset")
         self.reset_button.on_click(self._reset_values)
         self._aspect_ratio = aspect_ratio
@@ -246,13 +270,22 @@ class Striptool:
         self.selection.on_change("value", self.update_selection)
         self.build_plot()
 
+    def _empty_data(self) -> dict:
+        """Builds empty data source columns for time and each variable."""
+        data = {"x": np.array([], dtype="datetime64[ns]")}
+        for variable_name in self.pv_monitors:
+            data[variable_name] = np.array([], dtype=float)
+
+        return data
+
     def build_plot(self) -> None:
         """
         Creates the plot object.
         """
         self.plot = figure(sizing_mode="scale_both", aspect_ratio=self._aspect_ratio)
-        self.plot.line(x="x", y="y", line_width=2, source=self.source)
-        self.plot.yaxis.axis_label = self.live_variable
+        self._line = self.plot.line(
+            x="x", y=self.live_variable, line_width=2, source=self.source
+        )
 
         # as its scales, the plot uses all definedformats
         self.plot.xaxis.formatter = DatetimeTickFormatter(
@@ -264,39 +297,37 @@ class Striptool:
         )
 
         self.plot.xaxis.major_label_orientation = "vertical"
-
-        # add units to label
-        if self.pv_monitors[self.live_variable].units:
-            self.plot.yaxis.axis_label += (
-                f" ({self.pv_monitors[self.live_variable].units})"
-            )
+        self._set_y_axis_label()
 
         self.plot.xaxis.axis_label = "time (sec)"
 
+    def _set_y_axis_label(self) -> None:
+        """Labels the y axis with the live variable and its units."""
+        self.plot.yaxis.axis_label = self._y_axis_labels[self.live_variable]
+
     def update(self) -> None:
         """
-        Callback to update the plot to reflect updated process variable values or to
-        display a new process variable.
+        Callback to sample all process variables and stream the values to the plot.
 
 
         """
+        row = {"x": np.array([np.datetime64(datetime.now(), "ns")])}
+        for variable_name, monitor in self.pv_monitors.items():
+            row[variable_name] = np.array([monitor.poll()], dtype=float)
 
-        ts, ys = self.pv_monitors[self.live_variable].poll()
-        if self._limit is not None and len(ts) > self._limit:
-            ts = ts[-self._limit :]
-            ys = ys[-self._limit :]
-
-        self.source.data = dict(x=ts, y=ys)
+        self.source.stream(row, rollover=self._limit)
 
     def update_selection(self, attr, old, new):
         """
         Bokeh callback for assigning new live process variable.
         """
         self.live_variable = new
+        self._line.glyph.y = new
+        self._set_y_axis_label()
 
     def _reset_values(self) -> None:
         """
         Callback for resetting values on reset button push.
 
         """
-        self.pv_monitors[self.live_variable].reset()
+        self.source.data = self._empty_data()
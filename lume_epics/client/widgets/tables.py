@@ -6,29 +6,65 @@ variables.
 
 from typing import List, Dict
 import logging
+import numpy as np
 
-from bokeh.models import ColumnDataSource, DataTable, TableColumn, StringFormatter
+from bokeh.models import (
+    ColumnDataSource,
+    DataTable,
+    TableColumn,
+    StringFormatter,
+    ScientificFormatter,
+)
+from bokeh.core.property.validation import without_property_validation
 
 from lume_model.variables import ScalarVariable
 from lume_epics.client.controller import Controller, DEFAULT_SCALAR_VALUE
 from lume_epics.client.monitors import PVScalar
 
 
+def _round_sig_figs(values: np.ndarray, sig_figs: int) -> np.ndarray:
+    """Rounds an array of values to a number of significant figures.
+
+    Args:
+        values (np.ndarray): Values to round.
+
+        sig_figs (int): Number of significant figures to keep.
+
+    """
+    magnitude = np.abs(values)
+    nonzero = np.isfinite(magnitude) & (magnitude > 0)
+
+    # decimal places to keep for each value, zeros and non-finite values untouched
+    decimals = np.zeros(values.shape, dtype=int)
+    decimals[nonzero] = sig_figs - 1 - np.floor(np.log10(magnitude[nonzero]))
+
+    # keep the scale factor within float range for extreme magnitudes
+    decimals = np.clip(decimals, -300, 300)
+
+    scale = np.power(10.0, decimals)
+    return np.round(values * scale) / scale
+
+
 class ValueTable:
     """
-    Table of process variable names and values.
+    Table of process variable names and values. Values are held as floats rounded
+    to the table's significant figures and formatted by the browser.
 
     Attriibutes:
         _pv_monitors (Dict[str, PVScalar]): Monitors associated with process variables.
 
-        _output_values (dict): Dict mapping process variable name to current value.
-
         _source (ColumnDataSource): Data source for populating bokeh table.
 
         _labels (Dict[str, str]): Dictionary mapping pvname to label
 
         _unit_map (Dict[str, str]): Dictionary mapping pvname to units
 
+        _raw (np.ndarray): Values polled on the latest update, ordered by table row
+
+        _prev_raw (np.ndarray): Values polled on the previous update
+
+        _displayed (np.ndarray): Rounded values shown in the table
+
         table (DataTable): Bokeh data table
 
     """
@@ -53,20 +89,18 @@ class ValueTable:
         """
         # only creating pvs for non-image pvs
         self._pv_monitors = {}
-        self._output_values = {}
         self._labels = {}
         self._sig_figs = sig_figs
 
+        # set by controller monitor events, the table is only polled when dirty
+        self._dirty = True
+        controller.add_listener(self._mark_dirty)
+
         # be sure to surface units in the table
         self._unit_map = {}
 
         for variable in variables:
-            self._pv_monitors[variable.name] = PVScalar(variable, controller)
-            v = DEFAULT_SCALAR_VALUE
-
-            # format to sig figs
-            v = format(float("{:.{p}g}".format(v, p=self._sig_figs)))
-            self._output_values[variable.name] = v
+            self._pv_monitors[variable.name] = controller.monitor(variable, PVScalar)
 
             label_base = labels.get(variable.name, variable.name)
 
@@ -77,16 +111,27 @@ class ValueTable:
             else:
                 self._labels[variable.name] = label_base
 
+        # rows are polled into an array and compared with the previous poll, only
+        # changed values are rounded and patched
+        self._names = tuple(self._pv_monitors)
+        self._monitor_list = tuple(self._pv_monitors.values())
+        self._raw = np.empty(len(self._names), dtype=np.float64)
+        self._prev_raw = np.full(len(self._names), np.nan)
+        self._displayed = np.full(
+            len(self._names), DEFAULT_SCALAR_VALUE, dtype=np.float64
+        )
+
         self.create_table()
 
     def create_table(self) -> None:
         """
         Creates the bokeh table and populates variable data.
         """
-        x_vals = [self._labels[var] for var in self._output_values.keys()]
-        y_vals = list(self._output_values.values())
+        x_vals = [self._labels[var] for var in self._names]
 
-        table_data = dict(x=x_vals, y=y_vals)
+        # numeric column is sent to the client as a binary array and formatted by
+        # the browser, with exponents for values too small or large for decimals
+        table_data = dict(x=x_vals, y=self._displayed.copy())
         self._source = ColumnDataSource(table_data)
         columns = [
             TableColumn(
@@ -94,7 +139,11 @@ class ValueTable:
                 title="Variable",
                 formatter=StringFormatter(font_style="bold"),
             ),
-            TableColumn(field="y", title="Current Value"),
+            TableColumn(
+                field="y",
+                title="Current Value",
+                formatter=ScientificFormatter(precision=self._sig_figs - 1),
+            ),
         ]
 
         self.table = DataTable(
@@ -104,17 +153,39 @@ class ValueTable:
             index_position=None,
         )
 
+    @without_property_validation
     def update(self) -> None:
         """
-        Callback function to update data source to reflect updated values.
+        Callback function to update data source to reflect updated values. Only
+        rows whose displayed value changed are patched, and nothing is polled if no
+        monitor has updated since the last call.
         """
-        for variable in self._pv_monitors:
-            v = self._pv_monitors[variable].poll()
+        if not self._dirty:
+            return
+
+        # cleared before polling so that updates arriving meanwhile are kept
+        self._dirty = False
+
+        for i, monitor in enumerate(self._monitor_list):
+            self._raw[i] = monitor.poll()
+
+        changed = np.flatnonzero(self._raw != self._prev_raw)
+        if not changed.size:
+            return
+
+        self._prev_raw[changed] = self._raw[changed]
+
+        rounded = _round_sig_figs(self._raw[changed], self._sig_figs)
+        patches = [
+            (int(i), float(value))
+            for i, value in zip(changed, rounded)
+            if value != self._displayed[i]
+        ]
+        self._displayed[changed] = rounded
 
-            # format to sig figs
-            v = format(float("{:.{p}g}".format(v, p=self._sig_figs)))
-            self._output_values[variable] = v
+        if patches:
+            self._source.patch({"y": patches})
 
-        x_vals = [self._labels[var] for var in self._output_values.keys()]
-        y_vals = list(self._output_values.values())
-        self._source.data = dict(x=x_vals, y=y_vals)
+    def _mark_dirty(self, pvname: str) -> None:
+        """Controller listener flagging that monitored values may have changed."""
+        self._dirty = True
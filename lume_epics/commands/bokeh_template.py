@@ -1,54 +1,132 @@
-from bokeh.io import curdoc
 from bokeh.layouts import column
-from bokeh.server.server import Server
-from lume_epics.client.utils import render_from_yaml
-import argparse
-import sys
-
-import argparse
-
-
-parser = argparse.ArgumentParser(description="Process bokeh args")
-parser.add_argument("filename", type=str, help="Filename to load.")
-parser.add_argument(
-    "epics_config_filename", type=str, help="Filename for epics configuration."
-)
-parser.add_argument(
-    "--read-only", default=False, action="store_true", help="Render as read-only"
-)
-parser.add_argument(
-    "--ncol-widgets",
-    dest="ncol_widgets",
-    default=5,
-    type=int,
-    help="Number of widgets to render per column",
-)
-parser.add_argument(
-    "--striptool-limit",
-    dest="striptool_limit",
-    default=50,
-    type=int,
-    help="Number of striptool steps to keep",
-)
-
-args = parser.parse_args()
-
-filename = args.filename
-epics_config_filename = args.epics_config_filename
-read_only = args.read_only
-striptool_limit = args.striptool_limit
-ncol_widgets = args.ncol_widgets
-
-layout, callbacks = render_from_yaml(
-    filename,
-    epics_config_filename,
-    read_only=read_only,
-    striptool_limit=striptool_limit,
-    ncol_widgets=ncol_widgets,
-)
-
-
-curdoc().add_root(layout)
-
-for callback in callbacks:
-    curdoc().add_periodic_callback(callback, 250)
+from bokeh.models import Div
+from lume_epics.client.controller import Controller
+from lume_epics.client.utils import render_from_yaml, batch_callbacks, push_callbacks
+from lume_epics.utils import config_from_yaml
+
+# period in milliseconds at which striptools sample their variables
+STRIPTOOL_PERIOD_MS = 250
+
+
+def build_document(
+    doc,
+    filename: str,
+    epics_config_filename: str,
+    read_only: bool = False,
+    striptool_limit: int = 50,
+    ncol_widgets: int = 5,
+) -> None:
+    """Populates a bokeh document with the rendered template. A placeholder is
+    served first and the rendered layout is pushed to the client once built.
+
+    Args:
+        doc (Document): Bokeh document to populate
+        filename (str): Model variable configuration file
+        epics_config_filename (str): EPICS configuration file
+        read_only (bool): Render as read-only
+        striptool_limit (int): Number of striptool steps to keep
+        ncol_widgets (int): Number of widgets to render per column
+
+    """
+    root = column(
+        Div(text="<h3 style='text-align:center;'>Loading model...</h3>"),
+        sizing_mode="scale_both",
+    )
+    doc.add_root(root)
+
+    # resources of the session, set once the layout is rendered
+    session = {"closed": False, "controller": None, "stop_updates": None}
+
+    def close_session(session_context):
+        """Stops updates and closes the session's monitors once the browser session
+        ends, including sessions ending before the layout was rendered.
+        """
+        session["closed"] = True
+
+        if session["stop_updates"] is not None:
+            session["stop_updates"]()
+
+        if session["controller"] is not None:
+            session["controller"].close()
+
+    # registered before rendering so that no session ends without releasing monitors
+    doc.on_session_destroyed(close_session)
+
+    def render_layout():
+        """Builds the layout from the configuration files, swaps it in for the
+        placeholder, and registers the update callbacks.
+        """
+        if session["closed"]:
+            return
+
+        with open(epics_config_filename, "r") as f:
+            controller = Controller(config_from_yaml(f))
+
+        session["controller"] = controller
+
+        striptool_callbacks = []
+        layout, callbacks = render_from_yaml(
+            filename,
+            epics_config_filename,
+            read_only=read_only,
+            striptool_limit=striptool_limit,
+            ncol_widgets=ncol_widgets,
+            controller=controller,
+            striptool_callbacks=striptool_callbacks,
+        )
+
+        root.children = [layout]
+
+        # update widgets showing the latest values as monitor events arrive, sending
+        # all changes of a tick to the client in one message
+        session["stop_updates"] = push_callbacks(doc, controller, callbacks)
+        batch_callbacks(doc, callbacks)()
+
+        # striptools sample at a fixed period so that their time axis stays regular
+        if striptool_callbacks:
+            doc.add_periodic_callback(
+                batch_callbacks(doc, striptool_callbacks), STRIPTOOL_PERIOD_MS
+            )
+
+    doc.add_next_tick_callback(render_layout)
+
+
+# served directly with bokeh serve, which runs this module under a bokeh_app name:
+# $ bokeh serve lume_epics/commands/bokeh_template.py --args <filename> <epics_config>
+if __name__.startswith("bokeh_app"):
+    import argparse
+    from bokeh.io import curdoc
+
+    parser = argparse.ArgumentParser(description="Process bokeh args")
+    parser.add_argument("filename", type=str, help="Filename to load.")
+    parser.add_argument(
+        "epics_config_filename", type=str, help="Filename for epics configuration."
+    )
+    parser.add_argument(
+        "--read-only", default=False, action="store_true", help="Render as read-only"
+    )
+    parser.add_argument(
+        "--ncol-widgets",
+        dest="ncol_widgets",
+        default=5,
+        type=int,
+        help="Number of widgets to render per column",
+    )
+    parser.add_argument(
+        "--striptool-limit",
+        dest="striptool_limit",
+        default=50,
+        type=int,
+        help="Number of striptool steps to keep",
+    )
+
+    args = parser.parse_args()
+
+    build_document(
+        curdoc(),
+        args.filename,
+        args.epics_config_filename,
+        read_only=args.read_only,
+        striptool_limit=args.striptool_limit,
+        ncol_widgets=args.ncol_widgets,
+    )
@@ -1,6 +1,5 @@
 import click
-import subprocess
-from lume_epics.commands import bokeh_template
+from functools import partial
 
 
 @click.command()
@@ -9,43 +8,37 @@ from lume_epics.commands import bokeh_template
 @click.option("--read-only", is_flag=True)
 @click.option("--striptool-limit", default=50)
 @click.option("--ncol-widgets", default=5)
+@click.option("--port", default=5006)
 def render_from_template(
-    filename, epics_config_filename, read_only, striptool_limit, ncol_widgets
+    filename, epics_config_filename, read_only, striptool_limit, ncol_widgets, port
 ):
-    template_file = bokeh_template.__file__
-    if read_only:
-        subprocess.call(
-            [
-                "bokeh",
-                "serve",
-                template_file,
-                "--show",
-                "--args",
-                filename,
-                epics_config_filename,
-                "--striptool-limit",
-                str(striptool_limit),
-                "--ncol-widgets",
-                str(ncol_widgets),
-                "--read-only",
-            ]
-        )
-    else:
-        subprocess.call(
-            [
-                "bokeh",
-                "serve",
-                template_file,
-                "--show",
-                "--args",
-                filename,
-                epics_config_filename,
-                "--striptool-limit",
-                str(striptool_limit),
-                "--ncol-widgets",
-                str(ncol_widgets),
-            ]
+    # bokeh and the client stack are imported here so that the command line
+    # interface loads quickly, e.g. for --help
+    from bokeh.application import Application
+    from bokeh.application.handlers.function import FunctionHandler
+    from bokeh.server.server import Server
+
+    from lume_epics.commands.bokeh_template import build_document
+
+    # serve in process rather than spawning a bokeh serve subprocess
+    application = Application(
+        FunctionHandler(
+            partial(
+                build_document,
+                filename=filename,
+                epics_config_filename=epics_config_filename,
+                read_only=read_only,
+                striptool_limit=striptool_limit,
+                ncol_widgets=ncol_widgets,
+            )
         )
+    )
+
+    server = Server({"/": application}, port=port, num_procs=1)
+    server.start()
+
+    server.io_loop.add_callback(server.show, "/")
+    server.io_loop.start()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,7 @@
-import copy
 import logging
 import multiprocessing
-import time
 import signal
+import threading
 from typing import Dict
 from lume_model.variables import Variable, InputVariable, OutputVariable
 import numpy as np
@@ -19,8 +18,16 @@ import pcaspy
 os.environ["PYEPICS_LIBCA"] = os.path.dirname(pcaspy.__file__)
 
 from pcaspy import Driver, SimpleServer
+from lume_epics.utils import (
+    share_arrays,
+    restore_arrays,
+    discard_messages,
+    drain_output_updates,
+    InputBatcher,
+)
 from typing import Dict, Mapping, Union, List
 from functools import partial
+from operator import attrgetter
 
 
 # Each server must have their outQueue in which the comm server will set the inputs and outputs vars to be updated
@@ -28,6 +35,57 @@ from functools import partial
 
 logger = logging.getLogger(__name__)
 
+# child process variables served for images and arrays
+IMAGE_CHILD_FIELDS = (
+    "NDimensions_RBV",
+    "Dimensions_RBV",
+    "ArraySizeX_RBV",
+    "ArraySizeY_RBV",
+    "ArraySize_RBV",
+    "ArrayData_RBV",
+    "MinX_RBV",
+    "MinY_RBV",
+    "MaxX_RBV",
+    "MaxY_RBV",
+    "ColorMode_RBV",
+)
+
+ARRAY_CHILD_FIELDS = (
+    "NDimensions_RBV",
+    "Dimensions_RBV",
+    "ArraySize_RBV",
+    "ArrayData_RBV",
+)
+
+# image bound child fields and the variable attributes they serve
+IMAGE_BOUND_FIELDS = (
+    ("MinX_RBV", attrgetter("x_min")),
+    ("MinY_RBV", attrgetter("y_min")),
+    ("MaxX_RBV", attrgetter("x_max")),
+    ("MaxY_RBV", attrgetter("y_max")),
+)
+
+# actions taken by the driver on client writes, looked up per pvname
+WRITE_REJECT_OUTPUT = 0
+WRITE_REJECT_CONSTANT = 1
+WRITE_ACCEPT_INPUT = 2
+
+# seconds the pcaspy server waits for events on each pass of its processing loop
+SERVER_PROCESS_TIMEOUT = 0.1
+
+
+def _log_value(value: Union[float, np.ndarray]) -> Union[float, str]:
+    """Returns a value for debug logging, arrays are summarized by their shape."""
+    if isinstance(value, np.ndarray):
+        return f"<array of shape {value.shape}>"
+
+    return value
+
+
+def _flat(array: np.ndarray) -> np.ndarray:
+    """Returns a flat view of an array, copying only if it is not contiguous."""
+    return np.ascontiguousarray(array).ravel()
+
 
 # Thread running server processing loop
 class CAServerThread(CAThread):
@@ -43,20 +101,21 @@ class CAServerThread(CAThread):
         """
         super(CAThread, self).__init__()
         self.server = server
-        self.running = True
+        self._stop_event = threading.Event()
 
     def run(self):
         """
-        Start the server processing
+        Start the server processing. The timeout bounds how long monitor updates
+        posted by the driver from other threads wait to be sent.
         """
-        while self.running:
-            self.server.process(0.1)
+        while not self._stop_event.is_set():
+            self.server.process(SERVER_PROCESS_TIMEOUT)
 
     def stop(self):
         """
         Stop the server processing
         """
-        self.running = False
+        self._stop_event.set()
 
 
 class CAServer(CAProcess):
@@ -86,6 +145,8 @@ class CAServer(CAProcess):
 
         _out_queue (multiprocessing.Queue): Process model output variables and sync with pvAccess server
 
+        _cpu_affinity (Optional[List[int]]): CPUs the server process is pinned to
+
     """
 
     protocol = "ca"
@@ -99,6 +160,7 @@ class CAServer(CAProcess):
         out_queue: multiprocessing.Queue,
         running_indicator: multiprocessing.Value,
         *args,
+        cpu_affinity: List[int] = None,
         **kwargs,
     ) -> None:
         """Initialize server process.
@@ -110,9 +172,11 @@ class CAServer(CAProcess):
             in_queue (multiprocessing.Queue): Queue for tracking updates to input variables.
             out_queue (multiprocessing.Queue): Queue for tracking updates to output variables.
             running_indicator (multiprocessing.Value): Multiprocessing value for indicating if server running.
+            cpu_affinity (List[int]): Optional CPUs to pin the server process to, applied on Linux only.
 
         """
         super().__init__(*args, **kwargs)
+        self._cpu_affinity = cpu_affinity
         self._ca_server = None
         self._ca_driver = None
         self._server_thread = None
@@ -134,9 +198,22 @@ class CAServer(CAProcess):
             var_name: config["pvname"] for var_name, config in epics_config.items()
         }
 
-        # cached pv values
-        self._cached_values = {}
+        # served and constant variables are fixed for the life of the server
+        self._served = frozenset(
+            var_name for var_name, config in epics_config.items() if config.get("serve")
+        )
+        self._constant = frozenset(
+            var_name
+            for var_name, variable in input_variables.items()
+            if variable.is_constant
+        )
+
+        # batches input updates from the driver and monitor threads, created in
+        # the server process
+        self._input_batcher = None
         self._monitors = {}
+        self._child_to_parent_map = {}
+        self._write_plan = {}
 
     def update_pv(self, pvname, value) -> None:
         """Adds update to input process variable to the input queue.
@@ -153,9 +230,6 @@ class CAServer(CAProcess):
 
         variable = self._input_variables[model_var_name]
 
-        # check for already cached variable
-        variable = self._cached_values.get(model_var_name, variable)
-
         # check for image variable and proper assignments
         if variable.variable_type == "image":
 
@@ -182,12 +256,7 @@ class CAServer(CAProcess):
         else:
             variable.value = value
 
-        self._cached_values[model_var_name] = variable
-
-        # only update if not running
-        if not self._running_indicator.value:
-            self._in_queue.put({"protocol": "ca", "vars": self._cached_values})
-            self._cached_values = {}
+        self._input_batcher.add(model_var_name, variable)
 
     def _monitor_callback(self, pvname=None, value=None, **kwargs) -> None:
         """Callback executed on value change events."""
@@ -197,9 +266,6 @@ class CAServer(CAProcess):
         if not variable:
             variable = self._output_variables.get(model_var_name)
 
-        # check for already cached variable
-        variable = self._cached_values.get(model_var_name, variable)
-
         # check for image variable and proper assignments
         if variable.variable_type == "image":
 
@@ -225,16 +291,33 @@ class CAServer(CAProcess):
         else:
             variable.value = value
 
-        self._cached_values[model_var_name] = variable
-
-        # only update if not running
-        if not self._running_indicator.value:
-            self._in_queue.put({"protocol": "ca", "vars": self._cached_values})
-            self._cached_values = {}
+        self._input_batcher.add(model_var_name, variable)
 
     def _initialize_model(self):
         """Initialize model"""
-        self._in_queue.put({"protocol": "ca", "vars": self._input_variables})
+        self._in_queue.put(
+            share_arrays({"protocol": "ca", "vars": self._input_variables})
+        )
+
+    def _build_write_plan(self) -> None:
+        """Builds the map of served pvname to the driver's write action and the
+        model variable the write targets. Must be rebuilt if variables change.
+        """
+        pvname_to_varname = {
+            **self._pvname_to_varname_map,
+            **self._child_to_parent_map,
+        }
+
+        self._write_plan = {}
+        for pvname, var_name in pvname_to_varname.items():
+            if var_name in self._output_variables:
+                self._write_plan[pvname] = (WRITE_REJECT_OUTPUT, var_name)
+
+            elif var_name in self._constant:
+                self._write_plan[pvname] = (WRITE_REJECT_CONSTANT, var_name)
+
+            elif var_name in self._input_variables:
+                self._write_plan[pvname] = (WRITE_ACCEPT_INPUT, var_name)
 
     def setup_server(self) -> None:
         """Configure and start server."""
@@ -243,16 +326,26 @@ class CAServer(CAProcess):
 
         logger.info("Initializing CA server")
 
+        # create pvs for all external inputs up front so that their connections are
+        # established concurrently, monitors set up below share these pvs
+        external_pvs = {
+            var_name: epics.get_pv(self._varname_to_pvname_map[var_name])
+            for var_name in self._input_variables
+            if var_name not in self._served
+        }
+
         # update value with stored defaults
         for var_name in self._input_variables:
-            if self._epics_config[var_name]["serve"]:
+            if var_name in self._served:
                 self._input_variables[var_name].value = self._input_variables[
                     var_name
                 ].default
 
             else:
-                pvname = self._varname_to_pvname_map[var_name]
-                val = epics.caget(pvname)
+                val = None
+                if external_pvs[var_name].wait_for_connection():
+                    val = external_pvs[var_name].get(use_monitor=False)
+
                 if val is None:
                     logger.error(
                         f"Unable to connect to {self._varname_to_pvname_map[var_name]}"
@@ -265,6 +358,12 @@ class CAServer(CAProcess):
         # initialize channel access server
         self._ca_server = SimpleServer()
 
+        # batch input updates from the driver and monitor callbacks
+        self._input_batcher = InputBatcher(
+            self._in_queue, "ca", self._running_indicator, self.shutdown_event
+        )
+        self._input_batcher.start()
+
         # update output variable values
         self._initialize_model()
         model_outputs = None
@@ -275,6 +374,9 @@ class CAServer(CAProcess):
             except Empty:
                 pass
 
+        if model_outputs is not None:
+            restore_arrays(model_outputs)
+
         if self.shutdown_event.is_set():
             pass
 
@@ -284,21 +386,21 @@ class CAServer(CAProcess):
         # differentiate between values to serve and not to serve
         to_serve = []
         external = []
-        variables = copy.deepcopy(self._input_variables)
-        variables.update(self._output_variables)
+        # combined view of the variables, build_pvdb only reads them
+        variables = {**self._input_variables, **self._output_variables}
 
         for var in variables:
-            if var in self._epics_config:
-                if self._epics_config[var]["serve"]:
-                    to_serve.append(var)
+            if var in self._served:
+                to_serve.append(var)
 
-                else:
-                    external.append(var)
+            elif var in self._epics_config:
+                external.append(var)
 
         # build pvdb and child to parent map for area detector scheme
         pvdb, self._child_to_parent_map = build_pvdb(
             [variables[var_name] for var_name in to_serve], self._epics_config
         )
+        self._build_write_plan()
 
         # for external variables create monitors
         for var_name in external:
@@ -341,20 +443,47 @@ class CAServer(CAProcess):
         if self._ca_driver is not None:
             self._ca_driver.update_pvs(list(variables.values()))
 
+    def _set_cpu_affinity(self) -> None:
+        """Pins the server process to the configured CPUs. Threads started afterwards
+        inherit the affinity. Affinity is only supported on Linux.
+        """
+        if not self._cpu_affinity:
+            return
+
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("CPU affinity is not supported on this platform.")
+            return
+
+        try:
+            os.sched_setaffinity(0, set(self._cpu_affinity))
+
+        except OSError as e:
+            logger.warning("Unable to set CPU affinity %s: %s", self._cpu_affinity, e)
+
     def run(self) -> None:
         """Start server process."""
+        # pin before setup so that the server threads inherit the affinity
+        self._set_cpu_affinity()
         started = self.setup_server()
         if started:
             while not self.shutdown_event.is_set():
+                # block on the queue, timing out to check for shutdown
                 try:
-                    data = self._out_queue.get_nowait()
-                    inputs = data.get("input_variables", {})
-                    outputs = data.get("output_variables", {})
-                    self.update_pvs(inputs, outputs)
+                    data = self._out_queue.get(timeout=0.1)
 
                 except Empty:
-                    time.sleep(0.05)
-                    logger.debug("out queue empty")
+                    continue
+
+                # sentinel put on shutdown
+                if data is None:
+                    break
+
+                # post only the latest values from a burst of updates
+                inputs, outputs, stop = drain_output_updates(self._out_queue, data)
+                self.update_pvs(inputs, outputs)
+
+                if stop:
+                    break
 
             # if server thread running
             if self._server_thread is not None:
@@ -364,10 +493,24 @@ class CAServer(CAProcess):
         else:
             logger.info("Unable to set up server. Shutting down.")
 
+        # release shared memory of updates left unread
+        discard_messages(self._out_queue)
+
     def shutdown(self):
         """Safely shutdown the server process."""
         self.shutdown_event.set()
 
+        # wake the run loop if it is blocked on the queue
+        self._out_queue.put(None)
+
+
+def _get_units(variable: Variable) -> Union[str, None]:
+    """Returns the units explicitly set on a variable, or None if unset."""
+    if "units" in variable.__fields_set__:
+        return variable.units
+
+    return None
+
 
 def build_pvdb(variables: List[Variable], epics_config: dict) -> tuple:
     """Utility function for building dictionary (pvdb) used to initialize the channel
@@ -385,10 +528,11 @@ def build_pvdb(variables: List[Variable], epics_config: dict) -> tuple:
 
     """
     pvdb = {}
-    child_to_parent_map = {}
+    child_pairs = []
 
     for variable in variables:
         pvname = epics_config.get(variable.name)["pvname"]
+        units = _get_units(variable)
 
         if variable.variable_type == "image":
 
@@ -404,11 +548,11 @@ def build_pvdb(variables: List[Variable], epics_config: dict) -> tuple:
             else:
                 ndim = variable.value.ndim
                 shape = variable.value.shape
-                array_size_x = variable.value.shape[0]
-                array_size_y = variable.value.shape[1]
-                array_size = int(np.prod(variable.value.shape))
-                array_data = variable.value.flatten()
-                count = int(np.prod(variable.value.shape))
+                array_size_x = shape[0]
+                array_size_y = shape[1]
+                array_size = variable.value.size
+                array_data = _flat(variable.value)
+                count = array_size
 
             # infer color mode
             if ndim == 2:
@@ -421,144 +565,124 @@ def build_pvdb(variables: List[Variable], epics_config: dict) -> tuple:
                 logger.info("Color mode cannot be inferred from image shape %s.", ndim)
                 color_mode = np.nan
 
-            # assign default PVS
-            pvdb.update(
-                {
-                    f"{pvname}:NDimensions_RBV": {
-                        "type": "float",
-                        "prec": variable.precision,
-                        "value": ndim,
-                    },
-                    f"{pvname}:Dimensions_RBV": {
-                        "type": "int",
-                        "prec": variable.precision,
-                        "count": ndim,
-                        "value": shape,
-                    },
-                    f"{pvname}:ArraySizeX_RBV": {
-                        "type": "int",
-                        "value": array_size_x,
-                    },
-                    f"{pvname}:ArraySizeY_RBV": {
-                        "type": "int",
-                        "value": array_size_y,
-                    },
-                    f"{pvname}:ArraySize_RBV": {
-                        "type": "int",
-                        "value": array_size,
-                    },
-                    f"{pvname}:ArrayData_RBV": {
-                        "type": "float",
-                        "prec": variable.precision,
-                        "count": count,
-                        "value": array_data,
-                    },
-                    f"{pvname}:MinX_RBV": {
-                        "type": "float",
-                        "value": variable.x_min,
-                    },
-                    f"{pvname}:MinY_RBV": {
-                        "type": "float",
-                        "value": variable.y_min,
-                    },
-                    f"{pvname}:MaxX_RBV": {
-                        "type": "float",
-                        "value": variable.x_max,
-                    },
-                    f"{pvname}:MaxY_RBV": {
-                        "type": "float",
-                        "value": variable.y_max,
-                    },
-                    f"{pvname}:ColorMode_RBV": {
-                        "type": "int",
-                        "value": color_mode,
-                    },
-                }
-            )
-
-            child_to_parent_map.update(
-                {
-                    f"{pvname}:{child}": variable.name
-                    for child in [
-                        "NDimensions_RBV",
-                        "Dimensions_RBV",
-                        "ArraySizeX_RBV",
-                        "ArraySizeY_RBV",
-                        "ArraySize_RBV",
-                        "ArrayData_RBV",
-                        "MinX_RBV",
-                        "MinY_RBV",
-                        "MaxX_RBV",
-                        "MaxY_RBV",
-                        "ColorMode_RBV",
-                    ]
-                }
+            # assign default PVS, keyed by child field
+            child_specs = {
+                "NDimensions_RBV": {
+                    "type": "float",
+                    "prec": variable.precision,
+                    "value": ndim,
+                },
+                "Dimensions_RBV": {
+                    "type": "int",
+                    "prec": variable.precision,
+                    "count": ndim,
+                    "value": shape,
+                },
+                "ArraySizeX_RBV": {
+                    "type": "int",
+                    "value": array_size_x,
+                },
+                "ArraySizeY_RBV": {
+                    "type": "int",
+                    "value": array_size_y,
+                },
+                "ArraySize_RBV": {
+                    "type": "int",
+                    "value": array_size,
+                },
+                "ArrayData_RBV": {
+                    "type": "float",
+                    "prec": variable.precision,
+                    "count": count,
+                    "value": array_data,
+                },
+                "MinX_RBV": {
+                    "type": "float",
+                    "value": variable.x_min,
+                },
+                "MinY_RBV": {
+                    "type": "float",
+                    "value": variable.y_min,
+                },
+                "MaxX_RBV": {
+                    "type": "float",
+                    "value": variable.x_max,
+                },
+                "MaxY_RBV": {
+                    "type": "float",
+                    "value": variable.y_max,
+                },
+                "ColorMode_RBV": {
+                    "type": "int",
+                    "value": color_mode,
+                },
+            }
+            prefix = pvname + ":"
+            pvdb.update({prefix + field: spec for field, spec in child_specs.items()})
+
+            child_pairs.extend(
+                (prefix + child, variable.name) for child in IMAGE_CHILD_FIELDS
             )
 
-            if "units" in variable.__fields_set__:
-                pvdb[f"{pvname}:ArrayData_RBV"]["unit"] = variable.units
+            if units is not None:
+                child_specs["ArrayData_RBV"]["unit"] = units
 
             # handle rgb arrays
             if ndim > 2:
-                pvdb[f"{pvname}:ArraySizeZ_RBV"] = {
+                pvdb[prefix + "ArraySizeZ_RBV"] = {
                     "type": "int",
                     "value": variable.value.shape[2],
                 }
 
         elif variable.variable_type == "scalar":
-            pvdb[pvname] = variable.dict(exclude_unset=True, by_alias=True)
+            # only the fields read by pcaspy, avoiding a pydantic dict export
+            pvdb[pvname] = {"type": "float", "value": variable.value}
             if variable.value_range is not None:
                 pvdb[pvname]["hilim"] = variable.value_range[1]
                 pvdb[pvname]["lolim"] = variable.value_range[0]
 
-            if variable.units is not None:
-                pvdb[pvname]["unit"] = variable.units
+            if units is not None:
+                pvdb[pvname]["unit"] = units
 
         elif variable.variable_type == "array":
-
-            # assign default PVS
-            pvdb.update(
-                {
-                    f"{pvname}:NDimensions_RBV": {
-                        "type": "float",
-                        "prec": variable.precision,
-                        "value": variable.value.ndim,
-                    },
-                    f"{pvname}:Dimensions_RBV": {
-                        "type": "int",
-                        "prec": variable.precision,
-                        "count": variable.value.ndim,
-                        "value": variable.value.shape,
-                    },
-                    f"{pvname}:ArrayData_RBV": {
-                        "type": variable.value_type,
-                        "prec": variable.precision,
-                        "count": int(np.prod(variable.value.shape)),
-                        "value": variable.value.flatten(),
-                    },
-                    f"{pvname}:ArraySize_RBV": {
-                        "type": "int",
-                        "value": int(np.prod(variable.value.shape)),
-                    },
-                }
-            )
-
-            child_to_parent_map.update(
-                {
-                    f"{pvname}:{child}": variable.name
-                    for child in [
-                        "NDimensions_RBV",
-                        "Dimensions_RBV",
-                        "ArraySize_RBV",
-                        "ArrayData_RBV",
-                    ]
-                }
+            ndim = variable.value.ndim
+            array_size = variable.value.size
+
+            # assign default PVS, keyed by child field
+            child_specs = {
+                "NDimensions_RBV": {
+                    "type": "float",
+                    "prec": variable.precision,
+                    "value": ndim,
+                },
+                "Dimensions_RBV": {
+                    "type": "int",
+                    "prec": variable.precision,
+                    "count": ndim,
+                    "value": variable.value.shape,
+                },
+                "ArrayData_RBV": {
+                    "type": variable.value_type,
+                    "prec": variable.precision,
+                    "count": array_size,
+                    "value": _flat(variable.value),
+                },
+                "ArraySize_RBV": {
+                    "type": "int",
+                    "value": array_size,
+                },
+            }
+            prefix = pvname + ":"
+            pvdb.update({prefix + field: spec for field, spec in child_specs.items()})
+
+            child_pairs.extend(
+                (prefix + child, variable.name) for child in ARRAY_CHILD_FIELDS
             )
 
-            if "units" in variable.__fields_set__:
-                pvdb[f"{pvname}:ArrayData_RBV"]["unit"] = variable.units
+            if units is not None:
+                child_specs["ArrayData_RBV"]["unit"] = units
 
-    return pvdb, child_to_parent_map
+    return pvdb, dict(child_pairs)
 
 
 class CADriver(Driver):
@@ -571,6 +695,23 @@ class CADriver(Driver):
         super(CADriver, self).__init__()
         self.server = server
 
+        # child pvnames updated for image and array variables, built once
+        child_fields = {
+            "image": ("ArrayData_RBV", *(field for field, _ in IMAGE_BOUND_FIELDS)),
+            "array": ("ArrayData_RBV",),
+        }
+        self._child_pvnames = {}
+        for variables in (server._input_variables, server._output_variables):
+            for variable in variables.values():
+                fields = child_fields.get(variable.variable_type)
+                pvname = server._varname_to_pvname_map.get(variable.name)
+                if fields is None or pvname is None:
+                    continue
+
+                self._child_pvnames[variable.name] = {
+                    field: f"{pvname}:{field}" for field in fields
+                }
+
     def read(self, pvname: str) -> Union[float, np.ndarray]:
         """Method executed by server when clients read a Channel Access process
         variable.
@@ -593,13 +734,16 @@ class CADriver(Driver):
 
         """
 
-        # handle area detector types
-        model_var_name = self.server._pvname_to_varname_map.get(pvname)
+        # action and target variable, resolved once for area detector children
+        plan = self.server._write_plan.get(pvname)
+
+        if plan is None:
+            logger.error("%s not found in server variables.", pvname)
+            return False
 
-        if pvname in self.server._child_to_parent_map:
-            model_var_name = self.server._child_to_parent_map[pvname]
+        action, model_var_name = plan
 
-        if model_var_name in self.server._output_variables:
+        if action == WRITE_REJECT_OUTPUT:
             logger.warning(
                 "Cannot update variable %s. Output variables can only be updated via surrogate model callback.",
                 pvname,
@@ -607,29 +751,26 @@ class CADriver(Driver):
             return False
 
         if value is None:
-            logger.debug(f"None value provided for {pvname}")
+            logger.debug("None value provided for %s", pvname)
             return False
 
-        if model_var_name in self.server._input_variables:
-
-            if self.server._input_variables[model_var_name].is_constant:
-                logger.debug("Unable to update constant variable %s", model_var_name)
+        if action == WRITE_REJECT_CONSTANT:
+            logger.debug("Unable to update constant variable %s", model_var_name)
+            return False
 
-            else:
-                self.setParam(pvname, value)
-                self.updatePVs()
-                logger.debug(
-                    "Channel Access process variable %s updated with value %s",
-                    pvname,
-                    value,
-                )
+        self.setParam(pvname, value)
+        self.updatePVs()
 
-                self.server.update_pv(pvname=pvname, value=value)
-                return True
+        # avoid formatting array values on every put
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Channel Access process variable %s updated with value %s",
+                pvname,
+                _log_value(value),
+            )
 
-        else:
-            logger.error("%s not found in server variables.", pvname)
-            return False
+        self.server.update_pv(pvname=pvname, value=value)
+        return True
 
     def update_pvs(self, variables: List[Variable]) -> None:
         """Update output Channel Access process variables after model execution.
@@ -637,9 +778,12 @@ class CADriver(Driver):
         Args:
             variables (List[Variable]): List of variables.
         """
+        varname_to_pvname_map = self.server._varname_to_pvname_map
+        constant = self.server._constant
+
         for variable in variables:
-            pvname = self.server._varname_to_pvname_map[variable.name]
-            if variable.name in self.server._input_variables and variable.is_constant:
+            pvname = varname_to_pvname_map[variable.name]
+            if variable.name in constant:
                 logger.debug(
                     "Cannot update constant variable %s, %s", variable.name, pvname
                 )
@@ -650,11 +794,12 @@ class CADriver(Driver):
                         "Channel Access image process variable %s updated.",
                         pvname,
                     )
-                    self.setParam(pvname + ":ArrayData_RBV", variable.value.flatten())
-                    self.setParam(pvname + ":MinX_RBV", variable.x_min)
-                    self.setParam(pvname + ":MinY_RBV", variable.y_min)
-                    self.setParam(pvname + ":MaxX_RBV", variable.x_max)
-                    self.setParam(pvname + ":MaxY_RBV", variable.y_max)
+                    child_pvnames = self._child_pvnames[variable.name]
+                    self._set_if_changed(
+                        child_pvnames["ArrayData_RBV"], _flat(variable.value)
+                    )
+                    for field, get_bound in IMAGE_BOUND_FIELDS:
+                        self._set_if_changed(child_pvnames[field], get_bound(variable))
 
                 elif variable.variable_type == "scalar":
                     logger.debug(
@@ -662,7 +807,7 @@ class CADriver(Driver):
                         pvname,
                         variable.value,
                     )
-                    self.setParam(pvname, variable.value)
+                    self._set_if_changed(pvname, variable.value)
 
                 elif variable.variable_type == "array":
                     logger.debug(
@@ -670,7 +815,10 @@ class CADriver(Driver):
                         pvname,
                     )
 
-                    self.setParam(pvname + ":ArrayData_RBV", variable.value.flatten())
+                    self._set_if_changed(
+                        self._child_pvnames[variable.name]["ArrayData_RBV"],
+                        _flat(variable.value),
+                    )
 
                 else:
                     logger.debug(
@@ -680,3 +828,24 @@ class CADriver(Driver):
                     )
 
         self.updatePVs()
+
+    def _set_if_changed(self, pvname: str, value: Union[float, np.ndarray]) -> None:
+        """Sets a process variable value only if it differs from the value served,
+        so that clients are not sent monitor updates for unchanged values.
+
+        Args:
+            pvname (str): Process variable name.
+
+            value (Union[float, np.ndarray]): Value to assign to the process variable.
+
+        """
+        current = self.getParam(pvname)
+
+        if isinstance(value, np.ndarray):
+            if np.array_equal(current, value):
+                return
+
+        elif current == value:
+            return
+
+        self.setParam(pvname, value)
@@ -1,11 +1,16 @@
 import logging
-import copy
 import multiprocessing
 from multiprocessing.managers import DictProxy
 from queue import Full, Empty
 from lume_epics import model
+from lume_epics.utils import (
+    share_arrays,
+    restore_arrays,
+    discard_messages,
+    drain_output_updates,
+    InputBatcher,
+)
 import numpy as np
-import time
 import signal
 from typing import List, Union
 from functools import partial
@@ -42,7 +47,7 @@ class PVAServer(multiprocessing.Process):
         _providers (dict): Dictionary mapping pvname to p4p provider
         _running_indicator (multiprocessing.Value): Boolean indicator of running model execution
         _monitors (dict): Dictionary of monitor objects for read-only server
-        _cached_values (dict): Dict for caching values while model executes
+        _input_batcher (InputBatcher): Batches input updates sent to the model
         _pvname_to_varname_map (dict): Mapping of pvname to variable name
         _varname_to_pvname_map (dict): Mapping of variable name to pvame
 
@@ -91,9 +96,12 @@ class PVAServer(multiprocessing.Process):
         self._running_indicator = running_indicator
         # monitors for read only
         self._monitors = {}
-        self._cached_values = {}
         self._field_to_parent_map = {}
 
+        # batches input updates from the handler and monitor threads, created in
+        # the server process
+        self._input_batcher = None
+
         # utility maps
         self._pvname_to_varname_map = {
             config["pvname"]: var_name for var_name, config in epics_config.items()
@@ -117,9 +125,6 @@ class PVAServer(multiprocessing.Process):
         varname = self._pvname_to_varname_map[pvname]
         model_variable = self._input_variables[varname]
 
-        # check for already cached variable
-        model_variable = self._cached_values.get(varname, model_variable)
-
         if model_variable.variable_type == "image":
             model_variable.x_min = value.attrib["x_min"]
             model_variable.x_max = value.attrib["x_max"]
@@ -128,12 +133,7 @@ class PVAServer(multiprocessing.Process):
         else:
             model_variable.value = value
 
-        self._cached_values[varname] = model_variable
-
-        # only update if not running
-        if not self._running_indicator.value:
-            self._in_queue.put({"protocol": self.protocol, "vars": self._cached_values})
-            self._cached_values = {}
+        self._input_batcher.add(varname, model_variable)
 
     def _monitor_callback(self, pvname, V) -> None:
         """Callback function used for updating read_only process variables."""
@@ -144,34 +144,32 @@ class PVAServer(multiprocessing.Process):
         if not model_variable:
             model_variable = self._output_variables[varname]
 
-        # check for already cached variable
-        model_variable = self._cached_values.get(varname, model_variable)
-
         if model_variable.variable_type == "image":
             model_variable.x_min = value.attrib["x_min"]
             model_variable.x_max = value.attrib["x_max"]
             model_variable.y_min = value.attrib["y_min"]
             model_variable.y_max = value.attrib["y_max"]
 
-        self._cached_values[varname] = model_variable
-
-        # only update if not running
-        if not self._running_indicator.value:
-            self._in_queue.put({"protocol": self.protocol, "vars": self._cached_values})
-            self._cached_values = {}
+        self._input_batcher.add(varname, model_variable)
 
     def _initialize_model(self):
         """Initialize model"""
 
         rep = {"protocol": "pva", "vars": self._input_variables}
 
-        self._in_queue.put(rep)
+        self._in_queue.put(share_arrays(rep))
 
     def setup_server(self) -> None:
         """Configure and start server."""
 
         self._context = Context()
 
+        # batch input updates from the handler and monitor callbacks
+        self._input_batcher = InputBatcher(
+            self._in_queue, self.protocol, self._running_indicator, self.shutdown_event
+        )
+        self._input_batcher.start()
+
         # update value with stored defaults
         for var_name in self._input_variables:
             if self._epics_config[var_name]["serve"]:
@@ -204,6 +202,9 @@ class PVAServer(multiprocessing.Process):
             except Empty:
                 pass
 
+        if model_outputs is not None:
+            restore_arrays(model_outputs)
+
         if self.shutdown_event.is_set():
             pass
 
@@ -212,8 +213,8 @@ class PVAServer(multiprocessing.Process):
             model_output_vars = model_outputs.get("output_variables", {})
             self._output_variables.update(model_output_vars)
 
-            variables = copy.deepcopy(self._input_variables)
-            variables.update(self._output_variables)
+            # combined view of the variables, only read when building providers
+            variables = {**self._input_variables, **self._output_variables}
 
             # ignore interrupt in subprocess
             signal.signal(signal.SIGINT, signal.SIG_IGN)
@@ -489,21 +490,26 @@ class PVAServer(multiprocessing.Process):
 
         # mark running
         while not self.shutdown_event.is_set():
+            # block on the queue, timing out to check for shutdown
             try:
-                data = self._out_queue.get_nowait()
-                inputs = data.get("input_variables", {})
-                outputs = data.get("output_variables", {})
-                self.update_pvs(inputs, outputs)
-
-                # check cached values
-                if len(self._cached_values) > 0 and not self._running_indicator.value:
-                    self._in_queue.put(
-                        {"protocol": self.protocol, "vars": self._cached_values}
-                    )
+                data = self._out_queue.get(timeout=0.1)
 
             except Empty:
-                time.sleep(0.1)
-                logger.debug("out queue empty")
+                continue
+
+            # sentinel put on shutdown
+            if data is None:
+                break
+
+            # post only the latest values from a burst of updates
+            inputs, outputs, stop = drain_output_updates(self._out_queue, data)
+            self.update_pvs(inputs, outputs)
+
+            if stop:
+                break
+
+        # release shared memory of updates left unread
+        discard_messages(self._out_queue)
 
         self._context.close()
         if self.pva_server is not None:
@@ -515,6 +521,9 @@ class PVAServer(multiprocessing.Process):
         """Safely shutdown the server process."""
         self.shutdown_event.set()
 
+        # wake the run loop if it is blocked on the queue
+        self._out_queue.put(None)
+
 
 class PVAccessInputHandler:
     """
@@ -24,12 +24,21 @@ from lume_model.variables import Variable, InputVariable, OutputVariable
 from lume_model.models import BaseModel
 
 from lume_epics import EPICS_ENV_VARS
+from lume_epics.utils import (
+    share_arrays,
+    restore_arrays,
+    discard_messages,
+    start_shared_memory_tracker,
+)
 from .epics_pva_server import PVAServer
 from .epics_ca_server import CAServer
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# seconds to wait for each protocol server process to exit on stop
+SERVER_JOIN_TIMEOUT = 5
+
 
 class Server:
     """
@@ -146,7 +155,8 @@ class Server:
         if len(pva_config) > 0:
             self._protocols.append("pva")
 
-        # set up protocol based queues
+        # set up protocol based queues, large arrays are passed in shared memory
+        start_shared_memory_tracker()
         self.in_queue = multiprocessing.Queue()
         self.out_queues = dict()
         for protocol in self._protocols:
@@ -253,7 +263,7 @@ class Server:
 
         while not self.exit_event.is_set():
             try:
-                data = in_queue.get(timeout=0.1)
+                data = restore_arrays(in_queue.get(timeout=0.1))
 
                 # mark running
                 running_indicator.value = True
@@ -281,7 +291,7 @@ class Server:
                             }
 
                             if len(inputs):
-                                queue.put({"input_variables": inputs})
+                                queue.put(share_arrays({"input_variables": inputs}))
 
                     model_input = self.input_variables
 
@@ -296,7 +306,10 @@ class Server:
                                 or self._epics_config[var.name]["protocol"]
                                 in [protocol, "both"]
                             }
-                            queue.put({"output_variables": outputs}, timeout=0.1)
+                            queue.put(
+                                share_arrays({"output_variables": outputs}),
+                                timeout=0.1,
+                            )
 
                     except Exception as e:
                         traceback.print_exc()
@@ -358,6 +371,15 @@ class Server:
         if "pva" in self._protocols:
             self.pva_process.shutdown()
 
+        # once the servers have exited, release shared memory of unread inputs
+        if "ca" in self._protocols:
+            self.ca_process.join(timeout=SERVER_JOIN_TIMEOUT)
+
+        if "pva" in self._protocols:
+            self.pva_process.join(timeout=SERVER_JOIN_TIMEOUT)
+
+        discard_messages(self.in_queue)
+
         logger.info("Server is stopped.")
 
     @property
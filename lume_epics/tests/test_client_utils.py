@@ -0,0 +1,176 @@
+import os
+
+import pytest
+
+from lume_epics.client import utils
+
+
+VARIABLE_CONFIG = """
+input_variables:
+  input1:
+      name: input1
+      type: scalar
+      default: 1
+      range: [0, 256]
+      units: mm
+
+output_variables:
+  output1:
+    name: output1
+    type: scalar
+"""
+
+
+def test_variable_cache_roundtrip(tmp_path):
+    config_file = str(tmp_path / "config.yml")
+    with open(config_file, "w") as f:
+        f.write(VARIABLE_CONFIG)
+
+    mtime = os.stat(config_file).st_mtime_ns
+    input_variables, output_variables = utils._load_variables(config_file, mtime)
+
+    assert os.path.exists(config_file + ".cache.json")
+
+    # load from the sidecar, bypassing the in-memory cache
+    cached_inputs, cached_outputs = utils._load_variables.__wrapped__(
+        config_file, mtime
+    )
+
+    for name, variable in input_variables.items():
+        assert type(cached_inputs[name]) == type(variable)
+        assert cached_inputs[name].__fields_set__ == variable.__fields_set__
+        assert cached_inputs[name].default == variable.default
+        assert cached_inputs[name].units == variable.units
+
+    assert set(cached_outputs) == set(output_variables)
+
+
+class StubDocument:
+    """Records the held events and next tick callbacks of a bokeh document."""
+
+    def __init__(self):
+        self.held = []
+        self.next_tick_callbacks = []
+
+    def hold(self, policy):
+        self.held.append(policy)
+
+    def unhold(self):
+        self.held.append("unhold")
+
+    def add_next_tick_callback(self, callback):
+        self.next_tick_callbacks.append(callback)
+
+    def run_next_tick(self):
+        callbacks, self.next_tick_callbacks = self.next_tick_callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+class StubController:
+    """Registers monitor listeners like the controller, without any monitors."""
+
+    def __init__(self):
+        self.listeners = []
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def notify(self, pvname):
+        for listener in list(self.listeners):
+            listener(pvname)
+
+
+def test_batch_callbacks():
+    doc = StubDocument()
+    calls = []
+
+    run = utils.batch_callbacks(doc, [lambda: calls.append(1), lambda: calls.append(2)])
+    run()
+
+    assert calls == [1, 2]
+    assert doc.held == ["combine", "unhold"]
+
+
+def test_batch_callbacks_unholds_on_error():
+    doc = StubDocument()
+
+    def fail():
+        raise RuntimeError
+
+    run = utils.batch_callbacks(doc, [fail])
+
+    with pytest.raises(RuntimeError):
+        run()
+
+    assert doc.held == ["combine", "unhold"]
+
+
+def test_push_callbacks_coalesces_updates():
+    doc = StubDocument()
+    controller = StubController()
+    calls = []
+
+    utils.push_callbacks(doc, controller, [lambda: calls.append(1)])
+
+    # updates arriving before the scheduled run are combined into it
+    controller.notify("test:pv1")
+    controller.notify("test:pv2")
+    assert len(doc.next_tick_callbacks) == 1
+
+    doc.run_next_tick()
+    assert calls == [1]
+
+    # a later update schedules another run
+    controller.notify("test:pv1")
+    doc.run_next_tick()
+    assert calls == [1, 1]
+
+
+def test_push_callbacks_stop():
+    doc = StubDocument()
+    controller = StubController()
+    calls = []
+
+    stop = utils.push_callbacks(doc, controller, [lambda: calls.append(1)])
+
+    # a run already scheduled when stopping does not update the widgets
+    controller.notify("test:pv")
+    stop()
+    doc.run_next_tick()
+
+    assert controller.listeners == []
+    assert calls == []
+
+
+def test_lazy_tabs_build_on_activation():
+    built = []
+    updates = []
+
+    def builder(name):
+        def build():
+            built.append(name)
+            return utils.Div(text=name), lambda: updates.append(name)
+
+        return build
+
+    lazy = utils.LazyTabs([("first", builder("first")), ("second", builder("second"))])
+
+    # only the first tab is built, and shows its values once built
+    assert built == ["first"]
+    assert updates == ["first"]
+
+    lazy.tabs.active = 1
+    assert built == ["first", "second"]
+    assert updates == ["first", "second"]
+
+    # returning to a built tab does not build it again
+    lazy.tabs.active = 0
+    lazy.tabs.active = 1
+    assert built == ["first", "second"]
+
+    lazy.update()
+    assert updates == ["first", "second", "first", "second"]
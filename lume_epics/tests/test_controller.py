@@ -3,6 +3,8 @@ import time
 import numpy as np
 import epics
 
+from lume_epics.client.controller import Controller, DEFAULT_SCALAR_VALUE
+
 
 @pytest.fixture(scope="module")
 def image_variables(model):
@@ -11,6 +13,21 @@ def image_variables(model):
     ]
 
 
+@pytest.fixture(scope="module")
+def scalar_variables(model):
+    return [
+        var for var in model.input_variables.values() if var.variable_type == "scalar"
+    ]
+
+
+@pytest.fixture(scope="module")
+def unconnected_config(epics_config):
+    # configuration including a process variable that no server provides
+    config = dict(epics_config)
+    config["missing"] = {"pvname": "test:missing", "protocol": "ca"}
+    return config
+
+
 def test_controller_image_get(controller, image_variables, server):
     for var in image_variables:
         image = controller.get_image(var.name)
@@ -59,3 +76,53 @@ def test_controller_image_update(
             x_max=var.x_max,
             y_max=var.y_max,
         )
+
+
+def test_controller_remove_listener(epics_config):
+    controller = Controller(epics_config)
+    updates = []
+
+    controller.add_listener(updates.append)
+    controller._notify_listeners("test:pv")
+
+    controller.remove_listener(updates.append)
+    controller._notify_listeners("test:pv")
+
+    assert updates == ["test:pv"]
+    controller.close()
+
+
+def test_controller_get_values(
+    scalar_variables, unconnected_config, epics_config, server
+):
+    controller = Controller(unconnected_config)
+    varnames = [var.name for var in scalar_variables]
+
+    values = controller.get_values(varnames + ["missing"])
+
+    for varname in varnames:
+        pvname = epics_config[varname]["pvname"]
+        assert values[varname] == epics.caget(pvname)
+
+    # unconnected variables fall back on the default value
+    assert values["missing"] == DEFAULT_SCALAR_VALUE
+    controller.close()
+
+
+def test_controller_put_values(model, unconnected_config, epics_config, server):
+    controller = Controller(unconnected_config)
+    variable = model.input_variables["input1"]
+    pvname = epics_config[variable.name]["pvname"]
+
+    # puts to unconnected variables are skipped without affecting the others
+    controller.put_values({variable.name: 3.0, "missing": 3.0})
+    time.sleep(1)
+
+    assert epics.caget(pvname) == 3.0
+
+    # reset variables
+    controller.put_values({variable.name: variable.default})
+    time.sleep(1)
+
+    assert epics.caget(pvname) == variable.default
+    controller.close()
@@ -0,0 +1,65 @@
+import pickle
+from queue import Queue
+
+import numpy as np
+import pytest
+from multiprocessing.reduction import ForkingPickler
+from lume_model.variables import ImageOutputVariable, ScalarOutputVariable
+
+from lume_epics import utils
+
+
+@pytest.fixture
+def image_message():
+    image = ImageOutputVariable(name="image", axis_labels=["x", "y"])
+    image.value = np.random.uniform(0, 256, size=(200, 200))
+
+    scalar = ScalarOutputVariable(name="scalar")
+    scalar.value = 1.0
+
+    return {"output_variables": {"image": image, "scalar": scalar}}
+
+
+def test_shared_array_roundtrip(image_message):
+    image = image_message["output_variables"]["image"]
+    message = utils.share_arrays(image_message)
+
+    # the sent variables are not modified
+    assert image.value is not None
+
+    pickled = ForkingPickler.dumps(message)
+
+    # array data is passed outside of the pickle
+    assert len(pickled) < image.value.nbytes
+
+    restored = utils.restore_arrays(pickle.loads(pickled))
+    assert np.array_equal(restored["output_variables"]["image"].value, image.value)
+    assert restored["output_variables"]["scalar"].value == 1.0
+
+
+def test_discard_messages_releases_shared_arrays(image_message):
+    queue = Queue()
+    queue.put(utils.share_arrays(image_message))
+    shared = list(queue.queue[0].get("shared_arrays", {}).values())
+
+    utils.discard_messages(queue)
+
+    assert queue.empty()
+    for array in shared:
+        with pytest.raises(FileNotFoundError):
+            utils.shared_memory.SharedMemory(name=array.name)
+
+
+def test_drain_output_updates():
+    queue = Queue()
+    queue.put({"output_variables": {"x": 2, "y": 3}})
+    queue.put({"output_variables": {"x": 4}, "input_variables": {"a": 1}})
+    queue.put(None)
+
+    inputs, outputs, stop = utils.drain_output_updates(
+        queue, {"output_variables": {"x": 1}}
+    )
+
+    assert inputs == {"a": 1}
+    assert outputs == {"x": 4, "y": 3}
+    assert stop
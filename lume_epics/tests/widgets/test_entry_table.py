@@ -22,16 +22,14 @@ def entry_table(controller, entry_inputs, server):
 def test_entry_table_clear(entry_table, entry_inputs):
     # clear
     entry_table.clear()
-    for input_var in entry_inputs:
-        assert entry_table.text_inputs[input_var.name].value_input == ""
+    assert all(value == "" for value in entry_table.source.data["value"])
 
 
 # test entry table submit
 @pytest.mark.parametrize("value", [(7), (3)])
 def test_entry_table_sumbit(value, entry_table, entry_inputs, epics_config, server):
 
-    for input_var in entry_inputs:
-        entry_table.text_inputs[input_var.name].value_input = str(value)
+    entry_table.source.data["value"] = [str(value)] * len(entry_inputs)
 
     entry_table.submit()
 
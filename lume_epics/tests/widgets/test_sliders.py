@@ -34,8 +34,10 @@ def test_slider_update(value, slider_variables, sliders, epics_config):
 @pytest.mark.parametrize("value", [(4), (-8)])
 def test_slider_set(value, slider_variables, sliders, epics_config):
 
+    # puts are issued on release, when bokeh sets value_throttled
     for slider in sliders:
         slider.bokeh_slider.value = value
+        slider.bokeh_slider.value_throttled = value
 
     for var in slider_variables:
         pvname = epics_config[var.name]["pvname"]
@@ -23,11 +23,11 @@ def test_reset_button(striptool, server):
     striptool.update()
     striptool.update()
 
-    initial_val = striptool.source.data["y"]
+    initial_val = striptool.source.data[striptool.live_variable]
 
     striptool._reset_values()
     striptool.update()
 
-    after_reset = striptool.source.data["y"]
+    after_reset = striptool.source.data[striptool.live_variable]
 
     assert len(initial_val) != len(after_reset)
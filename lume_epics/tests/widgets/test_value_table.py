@@ -2,7 +2,9 @@ from lume_epics.tests.conftest import epics_config
 import pytest
 import epics
 import time
-from lume_epics.client.widgets.tables import ValueTable
+import numpy as np
+from bokeh.models import ScientificFormatter
+from lume_epics.client.widgets.tables import ValueTable, _round_sig_figs
 
 
 @pytest.fixture(scope="module")
@@ -46,3 +48,20 @@ def test_value_table_update(
         val = value_table._source.data["y"][val_idx]
 
         assert epics_val == float(val)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(1.23456789e-12, 1.2346e-12), (9.87654321e15, 9.8765e15), (0.5, 0.5)],
+)
+def test_value_table_round(value, expected):
+    rounded = _round_sig_figs(np.array([value]), 5)[0]
+    assert rounded == pytest.approx(expected, rel=1e-12)
+
+
+def test_value_table_formatter(value_table):
+    # values are formatted by the browser, with exponents at extreme magnitudes
+    value_column = value_table.table.columns[1]
+    assert value_column.field == "y"
+    assert isinstance(value_column.formatter, ScientificFormatter)
+    assert set(value_table._source.data) == {"x", "y"}
@@ -1,15 +1,42 @@
 import yaml
 import logging
+import os
 import sys
+import threading
+import time
+from queue import Empty
+
+import numpy as np
+
+# shared memory is only available from python 3.8
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:
+    shared_memory = None
+    resource_tracker = None
 
 logger = logging.getLogger(__name__)
 
+# arrays at least this size in bytes pass between processes through shared memory
+SHARED_ARRAY_MIN_BYTES = 1 << 16
+
+# input updates arriving within this interval in seconds are sent to the model
+# together, and held updates are retried at the idle interval while the model runs
+INPUT_BATCH_INTERVAL = 0.01
+INPUT_IDLE_INTERVAL = 0.1
+
+# server queue message keys holding dictionaries of variables
+VARIABLE_MESSAGE_KEYS = ("vars", "input_variables", "output_variables")
+
+# use the libyaml backed loader when PyYAML has been built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def config_from_yaml(config_file):
     """Load yaml file into configuration
     """
 
-    config = yaml.safe_load(config_file)
+    config = yaml.load(config_file, Loader=SafeLoader)
 
     if not isinstance(config, (dict,)):
         logger.exception("Invalid config file.")
@@ -65,3 +92,297 @@ def config_from_yaml(config_file):
         }
 
     return epics_configuration
+
+
+class SharedArray:
+    """Copy of a numpy array held in a shared memory block, so that the array data
+    does not pass through a queue's pipe. The block is created by the sending side
+    and unlinked by the receiving side, either when the array is read or when the
+    message carrying it is discarded.
+
+    Attributes:
+        name (str): Name of the shared memory block
+        shape (tuple): Shape of the array
+        dtype (str): Array data type
+
+    """
+
+    def __init__(self, array: np.ndarray):
+        """
+        Args:
+            array (np.ndarray): Array to copy into shared memory
+
+        """
+        block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+
+        try:
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+
+        finally:
+            block.close()
+
+        self.name = block.name
+        self.shape = array.shape
+        self.dtype = array.dtype.str
+
+    def read(self) -> np.ndarray:
+        """Copies the array out of shared memory and unlinks the block."""
+        block = shared_memory.SharedMemory(name=self.name)
+
+        try:
+            array = np.ndarray(self.shape, dtype=self.dtype, buffer=block.buf).copy()
+
+        finally:
+            block.close()
+            block.unlink()
+
+        return array
+
+    def release(self) -> None:
+        """Unlinks the block without reading it."""
+        try:
+            block = shared_memory.SharedMemory(name=self.name)
+
+        except FileNotFoundError:
+            return
+
+        block.close()
+        block.unlink()
+
+
+def share_arrays(message: dict) -> dict:
+    """Prepares a server queue message for sending, moving large array values of its
+    variables into shared memory. The variables in the message are replaced by
+    copies without values, the original variables are left untouched. Messages are
+    returned unchanged where shared memory is unavailable.
+
+    Args:
+        message (dict): Message mapping "vars", "input_variables" or
+            "output_variables" to dictionaries of variables
+
+    Returns:
+        dict: Message to put on the queue, restored with restore_arrays
+
+    """
+    if shared_memory is None or os.name != "posix":
+        return message
+
+    packed = dict(message)
+    shared = {}
+
+    for key in VARIABLE_MESSAGE_KEYS:
+        variables = message.get(key)
+        if not variables:
+            continue
+
+        replaced = None
+        for name, variable in variables.items():
+            value = getattr(variable, "value", None)
+
+            if (
+                isinstance(value, np.ndarray)
+                and value.nbytes >= SHARED_ARRAY_MIN_BYTES
+                and not value.dtype.hasobject
+            ):
+                if replaced is None:
+                    replaced = dict(variables)
+
+                shared[(key, name)] = SharedArray(value)
+                replaced[name] = variable.copy(update={"value": None})
+
+        if replaced is not None:
+            packed[key] = replaced
+
+    if shared:
+        packed["shared_arrays"] = shared
+
+    return packed
+
+
+def restore_arrays(message: dict) -> dict:
+    """Restores the array values of a message prepared with share_arrays, releasing
+    their shared memory.
+
+    Args:
+        message (dict): Message taken from a server queue
+
+    """
+    shared = message.pop("shared_arrays", None)
+
+    if shared:
+        for (key, name), array in shared.items():
+            message[key][name].value = array.read()
+
+    return message
+
+
+def release_arrays(message: dict) -> None:
+    """Releases the shared memory of a message prepared with share_arrays that will
+    not be read.
+
+    Args:
+        message (dict): Message taken from a server queue
+
+    """
+    if message:
+        for array in message.get("shared_arrays", {}).values():
+            array.release()
+
+
+def start_shared_memory_tracker() -> None:
+    """Starts the resource tracker before server processes are created so that all
+    processes share it. Blocks registered by the sending process are then
+    unregistered when the receiving process unlinks them, and blocks left behind by
+    a crashed process are still cleaned up when the server exits.
+    """
+    if resource_tracker is not None and os.name == "posix":
+        resource_tracker.ensure_running()
+
+
+def discard_messages(queue) -> None:
+    """Empties a server queue at shutdown, releasing the shared memory of unread
+    messages.
+
+    Args:
+        queue (multiprocessing.Queue): Queue to empty
+
+    """
+    while True:
+        try:
+            release_arrays(queue.get_nowait())
+
+        except Empty:
+            return
+
+
+class InputBatcher:
+    """Collects input variable updates from server callback threads and sends them
+    to the model in batches from a single thread. Only the latest update of each
+    variable is kept, so the pending updates are bounded by the number of
+    variables. Updates are held while the model is running.
+
+    Must be created in the server process, as it holds a lock and a thread.
+
+    Attributes:
+        _in_queue (multiprocessing.Queue): Queue for sending updates to the model
+        _protocol (str): Protocol reported with each batch
+        _running_indicator (multiprocessing.Value): Whether the model is running
+        _shutdown_event (multiprocessing.Event): Event stopping the batching thread
+        _pending (dict): Latest pending update by variable name
+        _lock (threading.Lock): Lock guarding the pending updates
+        _event (threading.Event): Set when updates are added
+        _thread (threading.Thread): Batching thread
+
+    """
+
+    def __init__(
+        self, in_queue, protocol: str, running_indicator, shutdown_event
+    ) -> None:
+        """
+        Args:
+            in_queue (multiprocessing.Queue): Queue for sending updates to the model
+            protocol (str): Protocol reported with each batch
+            running_indicator (multiprocessing.Value): Whether the model is running
+            shutdown_event (multiprocessing.Event): Event stopping the batching
+                thread
+
+        """
+        self._in_queue = in_queue
+        self._protocol = protocol
+        self._running_indicator = running_indicator
+        self._shutdown_event = shutdown_event
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        """Starts the batching thread."""
+        self._thread.start()
+
+    def add(self, name: str, variable) -> None:
+        """Queues an updated input variable for the next batch. Called from server
+        callback threads.
+
+        Args:
+            name (str): Name of the model variable
+            variable (InputVariable): Updated variable
+
+        """
+        with self._lock:
+            self._pending[name] = variable
+
+        self._event.set()
+
+    def _run(self) -> None:
+        """Sends pending updates once the batch interval has passed and the model
+        is idle. While the model runs, held updates are retried at the idle
+        interval rather than on every wakeup.
+        """
+        while not self._shutdown_event.is_set():
+            if self._event.wait(timeout=INPUT_IDLE_INTERVAL):
+                # collect updates arriving within the batch interval
+                time.sleep(INPUT_BATCH_INTERVAL)
+
+            elif not self._pending:
+                continue
+
+            # cleared before checking so that later additions wake the thread again
+            self._event.clear()
+
+            if self._running_indicator.value:
+                continue
+
+            with self._lock:
+                batch, self._pending = self._pending, {}
+
+            if batch:
+                self._in_queue.put(
+                    share_arrays({"protocol": self._protocol, "vars": batch})
+                )
+
+
+def drain_output_updates(queue, data: dict) -> tuple:
+    """Merges an output update with any others already waiting on the queue, keeping
+    the latest value for each variable. Shared arrays of superseded values are
+    released without being read.
+
+    Args:
+        queue (multiprocessing.Queue): Queue of updates from model execution.
+
+        data (dict): Update already taken from the queue.
+
+    Returns:
+        inputs (dict): Latest input variables by name
+        outputs (dict): Latest output variables by name
+        stop (bool): Whether the shutdown sentinel was taken from the queue
+
+    """
+    latest = {"input_variables": {}, "output_variables": {}}
+    shared = {}
+    stop = False
+
+    while True:
+        for key, variables in latest.items():
+            for name, variable in data.get(key, {}).items():
+                superseded = shared.pop((key, name), None)
+                if superseded is not None:
+                    superseded.release()
+
+                variables[name] = variable
+
+        shared.update(data.get("shared_arrays", {}))
+
+        try:
+            data = queue.get_nowait()
+
+        except Empty:
+            break
+
+        if data is None:
+            stop = True
+            break
+
+    restore_arrays({**latest, "shared_arrays": shared})
+
+    return latest["input_variables"], latest["output_variables"], stop